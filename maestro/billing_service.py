@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import json
 import os
 import secrets
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -12,7 +15,7 @@ from typing import Any
 import httpx
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from .utils import load_json, save_json
@@ -42,6 +45,11 @@ def _save_state(state: dict[str, Any]):
     save_json(_state_path(), state)
 
 
+TERMINAL_PURCHASE_STATUSES = {"licensed", "failed", "canceled"}
+EVENT_STREAM_CHECK_SECONDS = 0.5
+EVENT_STREAM_MAX_SECONDS = 900
+
+
 def _purchase_id() -> str:
     stamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
     return f"pur_{stamp}{secrets.token_hex(4)}"
@@ -156,6 +164,37 @@ def get_purchase(purchase_id: str):
     return _purchase_response(purchase)
 
 
+@app.get("/v1/solo/purchases/{purchase_id}/events")
+async def stream_purchase_events(purchase_id: str, timeout_seconds: int = 300):
+    """Server-sent events: push the purchase payload each time its status changes.
+
+    The stream closes once the purchase reaches a terminal status or after
+    `timeout_seconds`, so clients block on the socket instead of re-polling.
+    """
+    key = str(purchase_id).strip()
+    if not isinstance(_load_state()["purchases"].get(key), dict):
+        raise HTTPException(status_code=404, detail="purchase not found")
+
+    async def _events():
+        deadline = time.monotonic() + max(1, min(int(timeout_seconds), EVENT_STREAM_MAX_SECONDS))
+        last: dict[str, Any] | None = None
+        while True:
+            # _load_state reads the state file; keep that off the event loop.
+            state = await asyncio.to_thread(_load_state)
+            purchase = state["purchases"].get(key)
+            if not isinstance(purchase, dict):
+                return
+            payload = _purchase_response(purchase)
+            if payload != last:
+                yield f"data: {json.dumps(payload)}\n\n"
+                last = payload
+            if payload["status"] in TERMINAL_PURCHASE_STATUSES or time.monotonic() >= deadline:
+                return
+            await asyncio.sleep(EVENT_STREAM_CHECK_SECONDS)
+
+    return StreamingResponse(_events(), media_type="text/event-stream")
+
+
 @app.post("/v1/solo/dev/mark-paid")
 def mark_paid(request: MarkPaidRequest):
     state = _load_state()
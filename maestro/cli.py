@@ -69,7 +69,12 @@ def _add_ingest_parser(subparsers: argparse._SubParsersAction):
 
 
 def _add_setup_parser(subparsers: argparse._SubParsersAction):
-    subparsers.add_parser("setup", help="Run Maestro setup wizard (Solo default)")
+    parser = subparsers.add_parser("setup", help="Run Maestro setup wizard (Solo default)")
+    parser.add_argument(
+        "--recheck",
+        action="store_true",
+        help="Re-run prerequisite checks even if a previous run passed them",
+    )
 
 
 def _add_start_parser(subparsers: argparse._SubParsersAction):
@@ -146,6 +151,7 @@ def _add_tools_parser(subparsers: argparse._SubParsersAction):
 
     s = tools_sub.add_parser("search")
     s.add_argument("query")
+    s.add_argument("--deep", action="store_true", help="Always scan page reflections and pointer content")
 
     ct = tools_sub.add_parser("concept_trace")
     ct.add_argument("query")
@@ -430,10 +436,10 @@ def _handle_start(args: argparse.Namespace):
     runtime_main(port=args.port, store=str(resolve_fleet_store_root(args.store)))
 
 
-def _handle_setup(_: argparse.Namespace):
+def _handle_setup(args: argparse.Namespace):
     from .setup_wizard import main as setup_main
 
-    setup_main()
+    setup_main(recheck=bool(getattr(args, "recheck", False)))
 
 
 def _resolve_solo_ingest_project_name(args: argparse.Namespace, default_folder_name: str) -> tuple[str | None, bool]:
@@ -943,7 +949,7 @@ def _run_tools(args: argparse.Namespace):
         "get_sheet_index": lambda: tools.get_sheet_index(args.page_name),
         "list_regions": lambda: tools.list_regions(args.page_name),
         "get_region_detail": lambda: tools.get_region_detail(args.page_name, args.region_id),
-        "search": lambda: tools.search(args.query),
+        "search": lambda: tools.search(args.query, deep=getattr(args, "deep", False)),
         "concept_trace": lambda: tools.concept_trace(args.query, getattr(args, "limit", 8)),
         "governing_scope": lambda: tools.governing_scope(args.query, getattr(args, "limit", 6)),
         "detect_conflicts": lambda: tools.detect_conflicts(args.query, getattr(args, "limit", 8)),
@@ -469,7 +469,8 @@ def _workspace_event_slug(project_rel_parts: tuple[str, ...]) -> str | None:
     if len(project_rel_parts) < 2:
         return None
     candidate = str(project_rel_parts[1]).strip()
-    if not candidate or candidate == "_index.json":
+    # Also skip the index's temp files from atomic saves (_index.json.<pid>.<tid>.tmp).
+    if not candidate or candidate.startswith("_index.json"):
         return None
     return candidate
 
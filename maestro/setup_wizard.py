@@ -5,26 +5,30 @@ Interactive CLI to get construction superintendents up and running with Maestro.
 Rich TUI with cyan/blue Tron-inspired theme.
 """
 
+import functools
 import json
 import os
 import platform
 import re
+import shlex
 import shutil
+import socket
 import subprocess
 import sys
 import time
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+import httpx
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
 from rich.rule import Rule
 from rich.prompt import Prompt, Confirm
 from rich.align import Align
-from rich import box
 try:
     from .workspace_templates import (
         render_personal_agents_md,
@@ -32,6 +36,7 @@ try:
         render_workspace_env,
     )
     from .install_state import save_install_state
+    from .utils import dump_json_bytes, load_json
 except ImportError:  # pragma: no cover - direct script execution fallback
     from maestro.workspace_templates import (
         render_personal_agents_md,
@@ -39,6 +44,7 @@ except ImportError:  # pragma: no cover - direct script execution fallback
         render_workspace_env,
     )
     from maestro.install_state import save_install_state
+    from maestro.utils import dump_json_bytes, load_json
 
 # Theme colors
 CYAN = "cyan"
@@ -46,9 +52,58 @@ BLUE = "blue"
 BRIGHT_CYAN = "bright_cyan"
 DIM = "dim"
 
-console = Console(force_terminal=True if platform.system() == "Windows" else None)
+_SYSTEM = platform.system()
+_RELEASE = platform.release()
+_MACHINE = platform.machine()
+
+console = Console(force_terminal=True if _SYSTEM == "Windows" else None)
 
 TOTAL_STEPS = 10
+AGENT_FILES = ("SOUL.md", "AGENTS.md", "IDENTITY.md", "USER.md")
+_TELEGRAM_TOKEN_RE = re.compile(r'^\d+:[A-Za-z0-9_-]+$')
+PREREQ_PROBES = (
+    ("node", "node --version"),
+    ("npm", "npm --version"),
+    ("git", "git --version"),
+    ("openclaw", "openclaw --version"),
+)
+_NOT_INSTALLED = subprocess.CompletedProcess((), 127, stdout="", stderr="not installed")
+
+# Gateway bring-up for POSIX hosts: start, falling back to restart when the
+# gateway is already up.
+GATEWAY_UP_SCRIPT = (
+    "openclaw gateway start >/dev/null 2>&1 || openclaw gateway restart >/dev/null 2>&1"
+)
+DEFAULT_GATEWAY_PORT = 18789
+
+
+def _wait_ready(probe, timeout: float = 10.0, initial: float = 0.05) -> bool:
+    """Poll `probe` with exponential backoff until it succeeds or `timeout` passes."""
+    deadline = time.monotonic() + timeout
+    delay = initial
+    while time.monotonic() < deadline:
+        if probe():
+            return True
+        time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+        delay = min(delay * 1.6, 0.5)
+    return False
+
+
+def _port_open(host: str, port: int) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def _gateway_port() -> int:
+    """Gateway port from ~/.openclaw/openclaw.json, or OpenClaw's default."""
+    try:
+        config = load_json(Path.home() / ".openclaw" / "openclaw.json")
+        return int(config.get("gateway", {}).get("port") or DEFAULT_GATEWAY_PORT)
+    except (OSError, ValueError, TypeError, AttributeError):
+        return DEFAULT_GATEWAY_PORT
 
 
 def step_header(step: int, title: str):
@@ -69,6 +124,169 @@ def step_header(step: int, title: str):
     console.print()
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_os_label() -> str:
+    """Human-readable OS label; platform probes can hit disk, so compute once."""
+    if _SYSTEM == "Darwin":
+        # macOS — get version from platform.mac_ver()
+        mac_ver = platform.mac_ver()[0] or _RELEASE
+        chip = "Apple Silicon" if _MACHINE == "arm64" else "Intel"
+        return f"macOS {mac_ver} ({chip})"
+    elif _SYSTEM == "Windows":
+        # Detect Windows version: release may be "11" or "10" directly,
+        # or a build number. Also check build from platform.version().
+        try:
+            if _RELEASE == "11":
+                win_ver = "11"
+            elif _RELEASE == "10":
+                # Could still be Windows 11 — check build number
+                build = int(platform.version().split(".")[-1])
+                win_ver = "11" if build >= 22000 else "10"
+            else:
+                build = int(_RELEASE)
+                win_ver = "11" if build >= 22000 else "10"
+        except (ValueError, IndexError):
+            win_ver = _RELEASE
+        arch = "x64" if _MACHINE in ("AMD64", "x86_64") else _MACHINE
+        return f"Windows {win_ver} ({arch})"
+    else:
+        # Linux — try to get distro name
+        distro_name = ""
+        try:
+            os_release = platform.freedesktop_os_release()
+            distro_name = os_release.get("PRETTY_NAME", "")
+        except (OSError, AttributeError):
+            pass
+        if distro_name:
+            return f"{distro_name} ({_MACHINE})"
+        return f"Linux {_RELEASE} ({_MACHINE})"
+
+
+@functools.lru_cache(maxsize=1)
+def _provider_cards() -> tuple[Panel, ...]:
+    """Static provider comparison cards, built once and reused."""
+    return (
+        Panel(
+            f"[{DIM}]$2 / $12 per M tokens  •  1M context[/]\n"
+            "\n"
+            f"The [bold {BRIGHT_CYAN}]broadest knowledge base[/] of any model. [bold {BRIGHT_CYAN}]Native\n"
+            f"vision[/] means it actually reads your drawings — not\n"
+            f"just text descriptions of them. Strong at [bold {BRIGHT_CYAN}]synthesizing\n"
+            f"information across many sheets[/] at once. [bold {BRIGHT_CYAN}]One API key[/]\n"
+            "powers both the agent and plan analysis.\n"
+            "\n"
+            f"[{DIM}]Watch for: Can occasionally drift on very specific\n"
+            f"multi-step instructions.[/]",
+            border_style=BRIGHT_CYAN,
+            title=f"[bold {BRIGHT_CYAN}]★ Recommended: Google Gemini 3 Pro[/]",
+            width=72,
+        ),
+        Panel(
+            f"[{DIM}]$5 / $25 per M tokens  •  1M context[/]\n"
+            "\n"
+            f"The [bold {BRIGHT_CYAN}]most precise instruction follower[/] available.\n"
+            f"Excels at [bold {BRIGHT_CYAN}]complex coordination questions[/] that span\n"
+            f"multiple trades and disciplines. [bold {BRIGHT_CYAN}]Maintains accuracy\n"
+            f"across massive context[/] with minimal drift. Creative\n"
+            f"at [bold {BRIGHT_CYAN}]finding connections others miss[/].\n"
+            "\n"
+            f"[{DIM}]Watch for: Most expensive option. Still needs a\n"
+            f"separate Gemini key for plan vision.[/]",
+            border_style=DIM,
+            title=f"[{DIM}]2.[/] [bold {BRIGHT_CYAN}]Anthropic Claude Opus 4.6[/]",
+            width=72,
+        ),
+        Panel(
+            f"[{DIM}]$1.75 / $14 per M tokens  •  400K context[/]\n"
+            "\n"
+            f"[bold {BRIGHT_CYAN}]Fastest responses[/] and the [bold {BRIGHT_CYAN}]lowest hallucination rate[/]\n"
+            f"of any frontier model. Gives [bold {BRIGHT_CYAN}]clean, direct answers[/].\n"
+            f"Great for [bold {BRIGHT_CYAN}]rapid-fire jobsite questions[/] where speed\n"
+            "matters more than deep analysis.\n"
+            "\n"
+            f"[{DIM}]Watch for: Smaller context window may limit\n"
+            f"performance on very large plan sets. Needs separate\n"
+            f"Gemini key for vision.[/]",
+            border_style=DIM,
+            title=f"[{DIM}]3.[/] [bold {BRIGHT_CYAN}]OpenAI GPT-5.2[/]",
+            width=72,
+        ),
+        Panel(
+            f"[bold {BRIGHT_CYAN}]★ Recommended:[/] [white]Google Gemini 3 Pro — best price-to-performance, "
+            "and the same API key powers plan vision analysis (saves a step).[/]",
+            border_style=CYAN,
+            width=72,
+        ),
+    )
+
+
+def _credential_request(kind: str, secret: str) -> tuple[str, dict[str, str]]:
+    """URL and headers used to validate a credential of the given kind."""
+    if kind == 'google':
+        return f"https://generativelanguage.googleapis.com/v1/models?key={secret}", {}
+    if kind == 'anthropic':
+        return "https://api.anthropic.com/v1/messages", {"x-api-key": secret, "anthropic-version": "2023-06-01"}
+    if kind == 'openai':
+        return "https://api.openai.com/v1/models", {"Authorization": f"Bearer {secret}"}
+    if kind == 'telegram':
+        return f"https://api.telegram.org/bot{secret}/getMe", {}
+    raise ValueError(f"Unknown credential kind: {kind}")
+
+
+def _write_file_bytes(path: Path, data: bytes, mode: int = 0o644, fsync: bool = False):
+    """Write a pre-rendered buffer with raw os.write calls (no text-mode layer)."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _index_search_dirs(search_dirs: tuple[Path, ...]) -> list[dict[str, str]]:
+    """List each search dir once ({file name: path}) instead of stat-ing per file."""
+    indexes: list[dict[str, str]] = []
+    for search_dir in search_dirs:
+        try:
+            with os.scandir(search_dir) as entries:
+                indexes.append({entry.name: entry.path for entry in entries if entry.is_file()})
+        except OSError:
+            indexes.append({})
+    return indexes
+
+
+def _fast_copy(src: str | Path, dst: str | Path):
+    """Copy file contents in-kernel with sendfile; no metadata (mtime/mode) is carried over."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        try:
+            offset = 0
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # No sendfile to regular files here (macOS, Windows): plain copy.
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst)
+
+
+def _copy_agent_file(filename: str, indexes: list[dict[str, str]], workspace: Path) -> tuple[str, bool]:
+    """Copy the first matching agent file into the workspace."""
+    for index in indexes:
+        source = index.get(filename)
+        if source:
+            _fast_copy(source, workspace / filename)
+            return filename, True
+    return filename, False
+
+
 def success(text: str):
     console.print(f"  [green]✓[/] {text}")
 
@@ -85,35 +303,162 @@ def info(text: str):
 class SetupWizard:
     """Maestro setup wizard"""
 
-    def __init__(self):
+    _STEPS = (
+        ("Welcome", "step_welcome"),
+        ("Prerequisites", "step_prerequisites"),
+        ("AI Provider", "step_ai_provider"),
+        ("Gemini Vision Key", "step_gemini_key"),
+        ("Telegram Bot", "step_telegram_bot"),
+        ("Tailscale", "step_tailscale"),
+        ("Configure OpenClaw", "step_configure_openclaw"),
+        ("Configure Workspace", "step_configure_maestro"),
+        ("Connect Telegram", "step_connect_telegram"),
+    )
+
+    def __init__(self, recheck: bool = False):
+        self.recheck = recheck
         self.progress_file = Path.home() / ".maestro-setup.json"
         self.progress = self.load_progress()
-        self.is_windows = platform.system() == "Windows"
+        self._dirty = False
+        self._http: Optional[httpx.Client] = None
+        self._verified: set[str] = set()
+        self._oc_last_check: Optional[tuple[float, subprocess.CompletedProcess]] = None
+        self._frontend_build: Optional[tuple[Path, Future]] = None
+        self.is_windows = _SYSTEM == "Windows"
+
+    def _client(self) -> httpx.Client:
+        """Shared HTTP client so credential probes reuse pooled connections."""
+        if self._http is None:
+            self._http = httpx.Client(timeout=10, follow_redirects=False)
+        return self._http
+
+    def _check_credential(self, kind: str, secret: str) -> tuple[bool, httpx.Response]:
+        """Probe a provider/bot credential. Raises on network errors."""
+        url, headers = _credential_request(kind, secret)
+        response = self._client().get(url, headers=headers)
+        if kind == 'anthropic':
+            # No GET route on /messages; anything but 401 means the key authenticated.
+            return response.status_code != 401, response
+        return response.status_code == 200, response
+
+    def _verify_all_saved(self) -> set[str]:
+        """Validate saved credentials concurrently; returns the progress keys that checked out."""
+        checks: dict[str, tuple[str, str]] = {}
+        provider = self.progress.get('provider')
+        if self.progress.get('provider_key') and provider in ('google', 'anthropic', 'openai'):
+            checks['provider_key'] = (provider, self.progress['provider_key'])
+        if self.progress.get('gemini_key'):
+            checks['gemini_key'] = ('google', self.progress['gemini_key'])
+        if self.progress.get('telegram_token'):
+            checks['telegram_token'] = ('telegram', self.progress['telegram_token'])
+        if not checks:
+            return set()
 
-    def load_progress(self) -> Dict[str, Any]:
-        if self.progress_file.exists():
+        def _probe(item: tuple[str, tuple[str, str]]) -> tuple[str, bool]:
+            field, (kind, secret) = item
             try:
-                with open(self.progress_file, 'r') as f:
-                    return json.load(f)
+                return field, self._check_credential(kind, secret)[0]
             except Exception:
-                return {}
-        return {}
+                return field, False
 
-    def save_progress(self):
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.progress, f, indent=2)
+        with ThreadPoolExecutor(max_workers=len(checks)) as pool:
+            return {field for field, ok in pool.map(_probe, checks.items()) if ok}
+
+    def close(self):
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def load_progress(self) -> Dict[str, Any]:
+        try:
+            with open(self.progress_file, 'rb') as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            return {}
 
-    def run_command(self, cmd: str, check: bool = True) -> subprocess.CompletedProcess:
+    def save_progress(self):
+        """Mark progress as changed; it is flushed at the next step checkpoint."""
+        self._dirty = True
+
+    def checkpoint(self):
+        """Atomically write progress to disk if anything changed since the last flush."""
+        if not self._dirty:
+            return
+        tmp = self.progress_file.with_suffix(".tmp")
+        # One fsync per step: the rename must never expose a half-written file.
+        _write_file_bytes(tmp, dump_json_bytes(self.progress, indent=None), 0o600, fsync=True)
+        os.replace(tmp, self.progress_file)
+        self._dirty = False
+
+    def run_command(
+        self,
+        cmd: str | list[str],
+        check: bool = True,
+        timeout: float | None = 5.0,
+    ) -> subprocess.CompletedProcess:
+        """Run a command without a shell; probes are capped at `timeout` seconds."""
+        args = shlex.split(cmd) if isinstance(cmd, str) else list(cmd)
+        # Resolve the executable ourselves (picks up .cmd shims on Windows)
+        # so no intermediate shell is needed.
+        executable = shutil.which(args[0]) if args else None
+        if executable:
+            args[0] = executable
         try:
             result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, check=check
+                args, capture_output=True, text=True, check=check, timeout=timeout
             )
             return result
+        except subprocess.TimeoutExpired:
+            # A hung tool (broken wrapper, stale network mount) counts as not responding.
+            if check:
+                raise
+            return subprocess.CompletedProcess(args, 124, stdout="", stderr="timeout")
+        except FileNotFoundError:
+            if check:
+                raise
+            return subprocess.CompletedProcess(args, 127, stdout="", stderr=f"{args[0]}: command not found")
         except subprocess.CalledProcessError as e:
             if check:
                 raise
             return e
 
+    def _batch_sh(self, script: str, timeout: float | None = 60) -> subprocess.CompletedProcess:
+        """Run a short POSIX shell script as one child process."""
+        return self.run_command(["/bin/sh", "-c", script], check=False, timeout=timeout)
+
+    def _start_gateway(self) -> bool:
+        """Start (or restart) the OpenClaw gateway and wait until it accepts connections."""
+        if not self.is_windows and os.path.exists("/bin/sh"):
+            # start/restart fallback in a single spawn
+            self._batch_sh(GATEWAY_UP_SCRIPT)
+        else:
+            start_result = self.run_command(["openclaw", "gateway", "start"], check=False, timeout=30)
+            if start_result.returncode != 0:
+                # Try restart in case it's already running
+                self.run_command(["openclaw", "gateway", "restart"], check=False, timeout=30)
+
+        port = _gateway_port()
+        if _wait_ready(lambda: _port_open("127.0.0.1", port)):
+            return True
+
+        # Not listening yet — let the gateway's own status have the last word;
+        # only a "not running" on both streams counts as down, as before.
+        status_result = self.run_command(["openclaw", "gateway", "status"], check=False)
+        return not (
+            "not running" in (status_result.stdout or "").lower()
+            and "not running" in (status_result.stderr or "").lower()
+        )
+
+    def _check_openclaw(self) -> subprocess.CompletedProcess:
+        """`openclaw --version`, reusing a result from the last couple of seconds."""
+        if self._oc_last_check is not None:
+            checked_at, result = self._oc_last_check
+            if time.monotonic() - checked_at < 2.0:
+                return result
+        result = self.run_command("openclaw --version", check=False)
+        self._oc_last_check = (time.monotonic(), result)
+        return result
+
     def run_interactive_command(self, cmd: str) -> int:
         """Run a command attached to the terminal (required for OAuth/device flows)."""
         try:
@@ -150,11 +495,7 @@ class SetupWizard:
         candidate_files.extend(sorted(agents_root.glob("*/agent/auth.json")))
 
         for path in candidate_files:
-            try:
-                payload = json.loads(path.read_text(encoding="utf-8"))
-            except Exception:
-                continue
-
+            payload = load_json(path)
             if not isinstance(payload, dict):
                 continue
 
@@ -223,6 +564,15 @@ class SetupWizard:
         """Step 2: Check prerequisites"""
         step_header(2, "Prerequisites")
 
+        # Installed tooling doesn't change between resumes; a skipped OpenClaw
+        # install is the one case worth probing again.
+        cached = self.progress.get('prerequisites') and not self.progress.get('openclaw_skip')
+        if cached and not self.recheck:
+            success(self.progress.get('os', 'OS'))
+            success("Prerequisites (checked on a previous run)")
+            info("Run [bold white]maestro setup --recheck[/] to check again")
+            return True
+
         console.print(f"  [{DIM}]Checking system requirements...[/]")
         console.print()
 
@@ -231,61 +581,44 @@ class SetupWizard:
         has_openclaw = False
 
         # 1. OS detection
-        time.sleep(0.3)
-        system = platform.system()
-        release = platform.release()
-        machine = platform.machine()
-
-        if system == "Darwin":
-            # macOS — get version from platform.mac_ver()
-            mac_ver = platform.mac_ver()[0] or release
-            chip = "Apple Silicon" if machine == "arm64" else "Intel"
-            os_label = f"macOS {mac_ver} ({chip})"
-        elif system == "Windows":
-            # Detect Windows version: release may be "11" or "10" directly,
-            # or a build number. Also check build from platform.version().
-            try:
-                if release == "11":
-                    win_ver = "11"
-                elif release == "10":
-                    # Could still be Windows 11 — check build number
-                    build = int(platform.version().split(".")[-1])
-                    win_ver = "11" if build >= 22000 else "10"
-                else:
-                    build = int(release)
-                    win_ver = "11" if build >= 22000 else "10"
-            except (ValueError, IndexError):
-                win_ver = release
-            arch = "x64" if machine in ("AMD64", "x86_64") else machine
-            os_label = f"Windows {win_ver} ({arch})"
-        else:
-            # Linux — try to get distro name
-            distro_name = ""
-            try:
-                os_release = platform.freedesktop_os_release()
-                distro_name = os_release.get("PRETTY_NAME", "")
-            except (OSError, AttributeError):
-                pass
-            if distro_name:
-                os_label = f"{distro_name} ({machine})"
-            else:
-                os_label = f"Linux {release} ({machine})"
-
+        os_label = _detect_os_label()
         success(os_label)
         self.progress['os'] = os_label
         self.save_progress()
 
         # 2. Python
-        time.sleep(0.3)
         py_version = sys.version_info
         if py_version < (3, 11):
             error(f"Python {py_version.major}.{py_version.minor} — version 3.11+ required")
             return False
         success(f"Python {py_version.major}.{py_version.minor}.{py_version.micro}")
 
+        # Presence is a PATH lookup; only spawn `--version` for tools that
+        # exist, and run those independent probes together.
+        installed = [(name, cmd) for name, cmd in PREREQ_PROBES if shutil.which(name)]
+        probes = {name: _NOT_INSTALLED for name, _ in PREREQ_PROBES}
+        if installed:
+            # Only this spinner needs rich.progress; skip its import otherwise.
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
+            with Progress(
+                SpinnerColumn(style=CYAN),
+                TextColumn(f"[{DIM}]{{task.description}}[/]"),
+                console=console,
+                transient=True,
+            ) as spinner:
+                task = spinner.add_task("Checking installed tools...", total=len(installed))
+                with ThreadPoolExecutor(max_workers=len(installed)) as pool:
+                    futures = {
+                        pool.submit(self.run_command, cmd, check=False): name
+                        for name, cmd in installed
+                    }
+                    for future in as_completed(futures):
+                        probes[futures[future]] = future.result()
+                        spinner.advance(task)
+
         # 3. Node.js
-        time.sleep(0.3)
-        node_result = self.run_command("node --version", check=False)
+        node_result = probes["node"]
         if node_result.returncode == 0:
             has_node = True
             success(f"Node.js {node_result.stdout.strip()}")
@@ -293,8 +626,7 @@ class SetupWizard:
             error(f"Node.js — not installed  [{DIM}]https://nodejs.org[/]")
 
         # 4. npm
-        time.sleep(0.3)
-        npm_result = self.run_command("npm --version", check=False)
+        npm_result = probes["npm"]
         if npm_result.returncode == 0:
             has_npm = True
             success(f"npm {npm_result.stdout.strip()}")
@@ -302,8 +634,7 @@ class SetupWizard:
             error(f"npm — not installed  [{DIM}](comes with Node.js)[/]")
 
         # 5. git
-        time.sleep(0.3)
-        git_result = self.run_command("git --version", check=False)
+        git_result = probes["git"]
         if git_result.returncode == 0:
             git_ver = git_result.stdout.strip().replace("git version ", "")
             success(f"git {git_ver}")
@@ -311,8 +642,8 @@ class SetupWizard:
             warning(f"git — not installed  [{DIM}](recommended but not required)[/]")
 
         # 6. OpenClaw
-        time.sleep(0.3)
-        oc_result = self.run_command("openclaw --version", check=False)
+        oc_result = probes["openclaw"]
+        self._oc_last_check = (time.monotonic(), oc_result)
         if oc_result.returncode == 0:
             has_openclaw = True
             success(f"OpenClaw {oc_result.stdout.strip()}")
@@ -329,9 +660,9 @@ class SetupWizard:
         console.print()
 
         # Platform-specific terminal hint
-        if system == "Darwin":
+        if _SYSTEM == "Darwin":
             terminal_hint = f"[{DIM}italic]Tip: Press [bold]⌘T[/bold] for a new tab, or [bold]⌘N[/bold] for a new window.[/]"
-        elif system == "Windows":
+        elif _SYSTEM == "Windows":
             terminal_hint = f"[{DIM}italic]Tip: Press [bold]Ctrl+Shift+T[/bold] for a new tab, or search for [bold]Terminal[/bold] / [bold]PowerShell[/bold] in Start.[/]"
         else:
             terminal_hint = f"[{DIM}italic]Tip: Press [bold]Ctrl+Shift+T[/bold] for a new terminal tab.[/]"
@@ -375,9 +706,11 @@ class SetupWizard:
         ))
         console.print()
         Prompt.ask(f"  [{CYAN}]Press Enter when you're done[/]", default="", console=console)
+        # The user may have just installed it — force a fresh probe.
+        self._oc_last_check = None
 
         # Re-check
-        oc_result = self.run_command("openclaw --version", check=False)
+        oc_result = self._check_openclaw()
         if oc_result.returncode == 0:
             success(f"OpenClaw {oc_result.stdout.strip()}")
             self.progress['prerequisites'] = True
@@ -408,7 +741,7 @@ class SetupWizard:
         )
 
         if choice == "1":
-            oc_result = self.run_command("openclaw --version", check=False)
+            oc_result = self._check_openclaw()
             if oc_result.returncode != 0:
                 error("Still can't find OpenClaw. Close both terminals, reopen, and run maestro-setup.")
                 return False
@@ -440,71 +773,20 @@ class SetupWizard:
         )
         if has_saved_provider and has_saved_auth:
             provider = self.progress['provider']
-            info(f"Using saved provider: {provider}")
-            if not Confirm.ask(f"  [{CYAN}]Keep this provider?[/]", default=True, console=console):
-                self.progress.pop('provider', None)
-                self.progress.pop('provider_key', None)
-                self.progress.pop('provider_auth_method', None)
+            if 'provider_key' in self._verified:
+                info(f"Using saved provider: {provider} (key verified)")
+            else:
+                info(f"Using saved provider: {provider}")
+                if not Confirm.ask(f"  [{CYAN}]Keep this provider?[/]", default=True, console=console):
+                    self.progress.pop('provider', None)
+                    self.progress.pop('provider_key', None)
+                    self.progress.pop('provider_auth_method', None)
 
         if not self.progress.get('provider'):
-            # Stacked provider cards
-            console.print()
-            console.print(Panel(
-                f"[{DIM}]$2 / $12 per M tokens  •  1M context[/]\n"
-                "\n"
-                f"The [bold {BRIGHT_CYAN}]broadest knowledge base[/] of any model. [bold {BRIGHT_CYAN}]Native\n"
-                f"vision[/] means it actually reads your drawings — not\n"
-                f"just text descriptions of them. Strong at [bold {BRIGHT_CYAN}]synthesizing\n"
-                f"information across many sheets[/] at once. [bold {BRIGHT_CYAN}]One API key[/]\n"
-                "powers both the agent and plan analysis.\n"
-                "\n"
-                f"[{DIM}]Watch for: Can occasionally drift on very specific\n"
-                f"multi-step instructions.[/]",
-                border_style=BRIGHT_CYAN,
-                title=f"[bold {BRIGHT_CYAN}]★ Recommended: Google Gemini 3 Pro[/]",
-                width=72,
-            ))
-            console.print()
-            console.print(Panel(
-                f"[{DIM}]$5 / $25 per M tokens  •  1M context[/]\n"
-                "\n"
-                f"The [bold {BRIGHT_CYAN}]most precise instruction follower[/] available.\n"
-                f"Excels at [bold {BRIGHT_CYAN}]complex coordination questions[/] that span\n"
-                f"multiple trades and disciplines. [bold {BRIGHT_CYAN}]Maintains accuracy\n"
-                f"across massive context[/] with minimal drift. Creative\n"
-                f"at [bold {BRIGHT_CYAN}]finding connections others miss[/].\n"
-                "\n"
-                f"[{DIM}]Watch for: Most expensive option. Still needs a\n"
-                f"separate Gemini key for plan vision.[/]",
-                border_style=DIM,
-                title=f"[{DIM}]2.[/] [bold {BRIGHT_CYAN}]Anthropic Claude Opus 4.6[/]",
-                width=72,
-            ))
-            console.print()
-            console.print(Panel(
-                f"[{DIM}]$1.75 / $14 per M tokens  •  400K context[/]\n"
-                "\n"
-                f"[bold {BRIGHT_CYAN}]Fastest responses[/] and the [bold {BRIGHT_CYAN}]lowest hallucination rate[/]\n"
-                f"of any frontier model. Gives [bold {BRIGHT_CYAN}]clean, direct answers[/].\n"
-                f"Great for [bold {BRIGHT_CYAN}]rapid-fire jobsite questions[/] where speed\n"
-                "matters more than deep analysis.\n"
-                "\n"
-                f"[{DIM}]Watch for: Smaller context window may limit\n"
-                f"performance on very large plan sets. Needs separate\n"
-                f"Gemini key for vision.[/]",
-                border_style=DIM,
-                title=f"[{DIM}]3.[/] [bold {BRIGHT_CYAN}]OpenAI GPT-5.2[/]",
-                width=72,
-            ))
-            console.print()
-
-            # Recommended callout
-            console.print(Panel(
-                f"[bold {BRIGHT_CYAN}]★ Recommended:[/] [white]Google Gemini 3 Pro — best price-to-performance, "
-                "and the same API key powers plan vision analysis (saves a step).[/]",
-                border_style=CYAN,
-                width=72,
-            ))
+            # Stacked provider cards + recommended callout
+            for card in _provider_cards():
+                console.print()
+                console.print(card)
             console.print()
 
             choice = Prompt.ask(
@@ -660,27 +942,8 @@ class SetupWizard:
             # Test the key
             info("Testing API key...")
             try:
-                import httpx
-                if provider == 'google':
-                    response = httpx.get(
-                        f"https://generativelanguage.googleapis.com/v1/models?key={api_key}",
-                        timeout=10,
-                    )
-                    valid = response.status_code == 200
-                elif provider == 'anthropic':
-                    response = httpx.get(
-                        "https://api.anthropic.com/v1/messages",
-                        headers={"x-api-key": api_key, "anthropic-version": "2023-06-01"},
-                        timeout=10,
-                    )
-                    valid = response.status_code != 401
-                elif provider == 'openai':
-                    response = httpx.get(
-                        "https://api.openai.com/v1/models",
-                        headers={"Authorization": f"Bearer {api_key}"},
-                        timeout=10,
-                    )
-                    valid = response.status_code == 200
+                if provider in ('google', 'anthropic', 'openai'):
+                    valid, _ = self._check_credential(provider, api_key)
                 else:
                     valid = True
 
@@ -726,9 +989,12 @@ class SetupWizard:
                 return True
 
         if self.progress.get('gemini_key'):
-            info("Using saved Gemini API key")
-            if not Confirm.ask(f"  [{CYAN}]Keep this key?[/]", default=True, console=console):
-                self.progress.pop('gemini_key', None)
+            if 'gemini_key' in self._verified:
+                info("Using saved Gemini API key (verified)")
+            else:
+                info("Using saved Gemini API key")
+                if not Confirm.ask(f"  [{CYAN}]Keep this key?[/]", default=True, console=console):
+                    self.progress.pop('gemini_key', None)
 
         if not self.progress.get('gemini_key'):
             console.print(Panel(
@@ -750,12 +1016,8 @@ class SetupWizard:
 
             info("Testing API key...")
             try:
-                import httpx
-                response = httpx.get(
-                    f"https://generativelanguage.googleapis.com/v1/models?key={api_key}",
-                    timeout=10,
-                )
-                if response.status_code != 200:
+                valid, _ = self._check_credential('google', api_key)
+                if not valid:
                     error("API key is invalid")
                     return False
             except Exception as e:
@@ -790,9 +1052,12 @@ class SetupWizard:
                 return True
 
         if self.progress.get('telegram_token'):
-            info("Using saved Telegram bot token")
-            if not Confirm.ask(f"  [{CYAN}]Keep this bot?[/]", default=True, console=console):
-                self.progress.pop('telegram_token', None)
+            if 'telegram_token' in self._verified:
+                info("Using saved Telegram bot token (verified)")
+            else:
+                info("Using saved Telegram bot token")
+                if not Confirm.ask(f"  [{CYAN}]Keep this bot?[/]", default=True, console=console):
+                    self.progress.pop('telegram_token', None)
 
         if not self.progress.get('telegram_token'):
             console.print(Panel(
@@ -809,18 +1074,14 @@ class SetupWizard:
 
             bot_token = Prompt.ask(f"  [{CYAN}]Paste your bot token[/]", console=console).strip()
 
-            if not re.match(r'^\d+:[A-Za-z0-9_-]+$', bot_token):
+            if not _TELEGRAM_TOKEN_RE.match(bot_token):
                 error("That doesn't look like a valid bot token")
                 return False
 
             info("Testing bot token...")
             try:
-                import httpx
-                response = httpx.get(
-                    f"https://api.telegram.org/bot{bot_token}/getMe",
-                    timeout=10,
-                )
-                if response.status_code != 200:
+                valid, response = self._check_credential('telegram', bot_token)
+                if not valid:
                     error("Bot token is invalid")
                     return False
 
@@ -861,8 +1122,7 @@ class SetupWizard:
             width=60,
         ))
 
-        result = self.run_command("tailscale --version", check=False)
-        if result.returncode != 0:
+        if shutil.which("tailscale") is None:
             warning("Tailscale is not installed")
             if self.is_windows:
                 console.print(f"  [{DIM}]Download from:[/] [bold white]https://tailscale.com/download/windows[/]")
@@ -876,8 +1136,7 @@ class SetupWizard:
                 self.save_progress()
                 return True
 
-            result = self.run_command("tailscale --version", check=False)
-            if result.returncode != 0:
+            if shutil.which("tailscale") is None:
                 error("Still can't find Tailscale")
                 return False
 
@@ -910,14 +1169,20 @@ class SetupWizard:
         step_header(7, "Configuring OpenClaw")
 
         config_dir = Path.home() / ".openclaw"
-        config_dir.mkdir(parents=True, exist_ok=True)
+        # One mkdir creates both the config dir and the session directory
+        # OpenClaw expects.
+        sessions_dir = config_dir / "agents" / "maestro-personal" / "sessions"
+        sessions_dir.mkdir(parents=True, exist_ok=True)
         config_file = config_dir / "openclaw.json"
 
         workspace_path = str(Path.home() / ".openclaw" / "workspace-maestro")
 
-        if config_file.exists():
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+        try:
+            original_bytes = config_file.read_bytes()
+        except FileNotFoundError:
+            original_bytes = b""
+        if original_bytes:
+            config = json.loads(original_bytes)
             info("Found existing OpenClaw config, merging...")
         else:
             config = {}
@@ -950,19 +1215,23 @@ class SetupWizard:
         if 'list' not in config['agents']:
             config['agents']['list'] = []
 
+        # Index agents by id (position for id-less entries) so the upsert is a
+        # dict operation; insertion order preserves the on-disk list order.
+        agents_by_id = {
+            agent.get('id', index): agent
+            for index, agent in enumerate(config['agents']['list'])
+        }
         # Remove legacy defaults to keep a single clean personal agent.
-        config['agents']['list'] = [
-            a for a in config['agents']['list']
-            if a.get('id') not in ('maestro', 'maestro-company', 'maestro-personal')
-        ]
-
-        config['agents']['list'].append({
+        for legacy_id in ('maestro', 'maestro-company', 'maestro-personal'):
+            agents_by_id.pop(legacy_id, None)
+        agents_by_id['maestro-personal'] = {
             "id": "maestro-personal",
             "name": "Maestro Personal",
             "default": True,
             "model": self.progress['model'],
             "workspace": workspace_path,
-        })
+        }
+        config['agents']['list'] = list(agents_by_id.values())
 
         if 'channels' not in config:
             config['channels'] = {}
@@ -987,14 +1256,17 @@ class SetupWizard:
         else:
             warning("Telegram is not configured — local/web usage remains fully available.")
 
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
-
-        success(f"OpenClaw config written to {config_file}")
+        # All edits are merged in memory; write once, atomically, and only
+        # when something actually changed (e.g. not on a no-op resume).
+        config_bytes = dump_json_bytes(config)
+        if config_bytes != original_bytes:
+            tmp = config_file.with_suffix(".json.tmp")
+            _write_file_bytes(tmp, config_bytes, mode=0o600)
+            os.replace(tmp, config_file)
+            success(f"OpenClaw config written to {config_file}")
+        else:
+            success(f"OpenClaw config already up to date at {config_file}")
 
-        # Create session directory that OpenClaw expects
-        sessions_dir = config_dir / "agents" / "maestro-personal" / "sessions"
-        sessions_dir.mkdir(parents=True, exist_ok=True)
         success("Created agent session directory")
 
         self.progress['openclaw_configured'] = True
@@ -1022,29 +1294,26 @@ class SetupWizard:
         repo_root = maestro_pkg.parent
         agent_dir = maestro_pkg / "agent" if (maestro_pkg / "agent").exists() else repo_root / "agent"
 
-        for filename in ['SOUL.md', 'AGENTS.md', 'IDENTITY.md', 'USER.md']:
-            src = None
-            for search_dir in [agent_dir, repo_root, maestro_pkg]:
-                candidate = search_dir / filename
-                if candidate.exists():
-                    src = candidate
-                    break
-
-            if src:
-                shutil.copy2(src, workspace / filename)
+        indexes = _index_search_dirs((agent_dir, repo_root, maestro_pkg))
+        with ThreadPoolExecutor(max_workers=len(AGENT_FILES)) as pool:
+            copied = list(pool.map(
+                lambda filename: _copy_agent_file(filename, indexes, workspace),
+                AGENT_FILES,
+            ))
+        # Report after all copies finish so output is not interleaved.
+        for filename, ok in copied:
+            if ok:
                 success(f"Copied {filename}")
             else:
                 warning(f"Couldn't find {filename} — you can add it later")
 
         # Solo workspace uses project-capable AGENTS policy.
-        with open(workspace / "AGENTS.md", "w") as f:
-            f.write(render_personal_agents_md())
+        _write_file_bytes(workspace / "AGENTS.md", render_personal_agents_md().encode("utf-8"))
         success("Generated Personal AGENTS.md")
 
         provider_env_key = self.progress.get('provider_env_key', 'GEMINI_API_KEY')
         tools_md = render_personal_tools_md(active_provider_env_key=provider_env_key)
-        with open(workspace / "TOOLS.md", 'w') as f:
-            f.write(tools_md)
+        _write_file_bytes(workspace / "TOOLS.md", tools_md.encode("utf-8"))
         success("Generated TOOLS.md")
 
         knowledge_store = workspace / "knowledge_store"
@@ -1054,15 +1323,15 @@ class SetupWizard:
         self.progress['store_root'] = str(knowledge_store.resolve())
 
         skills_dir = workspace / "skills" / "maestro"
-        skills_dir.mkdir(parents=True, exist_ok=True)
-
         skill_src = agent_dir / "skills" / "maestro"
-        if skill_src.exists():
-            if skills_dir.exists():
-                shutil.rmtree(skills_dir)
-            shutil.copytree(skill_src, skills_dir)
+        if skill_src.is_dir():
+            # Clear first so files removed upstream don't linger. Copy rather
+            # than link: workspace skill files may be edited in place.
+            shutil.rmtree(skills_dir, ignore_errors=True)
+            shutil.copytree(skill_src, skills_dir, dirs_exist_ok=True)
             success("Copied Maestro skill")
         else:
+            skills_dir.mkdir(parents=True, exist_ok=True)
             warning("Couldn't find skill files — tools will still work via CLI")
 
         env_file = workspace / ".env"
@@ -1074,43 +1343,29 @@ class SetupWizard:
             agent_role="project",
             model_auth_method=self.progress.get('provider_auth_method', ''),
         )
-        with open(env_file, 'w') as f:
-            f.write(env_content)
+        # .env holds provider keys — create it owner-only.
+        _write_file_bytes(env_file, env_content.encode("utf-8"), mode=0o600)
         success("Created .env")
 
         # Build workspace frontend if it exists (with legacy fallback).
         workspace_frontend_dir = repo_root / "workspace_frontend"
         legacy_frontend_dir = repo_root / "frontend"
         frontend_dir: Path | None = None
-        if workspace_frontend_dir.exists() and (workspace_frontend_dir / "package.json").exists():
+        # One stat on package.json answers both "dir exists" and "is a frontend".
+        if (workspace_frontend_dir / "package.json").is_file():
             frontend_dir = workspace_frontend_dir
-        elif legacy_frontend_dir.exists() and (legacy_frontend_dir / "package.json").exists():
+        elif (legacy_frontend_dir / "package.json").is_file():
             frontend_dir = legacy_frontend_dir
 
         if frontend_dir is not None:
             console.print()
-            info("Building workspace frontend...")
-
-            npm_check = self.run_command("npm --version", check=False)
-            if npm_check.returncode == 0:
-                install_result = self.run_command(
-                    f'npm install --prefix "{frontend_dir}"', check=False
-                )
-                if install_result.returncode == 0:
-                    build_result = self.run_command(
-                        f'npm run build --prefix "{frontend_dir}"', check=False
-                    )
-                    if build_result.returncode == 0:
-                        success("Workspace frontend built")
-                    else:
-                        warning("Workspace frontend build failed — you can try later:")
-                        console.print(f"  [{DIM}]cd {frontend_dir}[/]")
-                        console.print(f"  [{DIM}]npm run build[/]")
-                else:
-                    warning("npm install failed — you can try later:")
-                    console.print(f"  [{DIM}]cd {frontend_dir}[/]")
-                    console.print(f"  [{DIM}]npm install[/]")
-                    console.print(f"  [{DIM}]npm run build[/]")
+            if shutil.which("npm"):
+                # Nothing later in setup needs the bundle, so build it in the
+                # background; run() collects and reports the result.
+                info("Building workspace frontend in the background...")
+                pool = ThreadPoolExecutor(max_workers=1)
+                self._frontend_build = (frontend_dir, pool.submit(self._build_frontend, frontend_dir))
+                pool.shutdown(wait=False)
             else:
                 warning("npm not found — workspace frontend needs Node.js to build")
                 console.print(f"  [{DIM}]Install Node.js from https://nodejs.org[/]")
@@ -1132,7 +1387,7 @@ class SetupWizard:
             "fleet_store_root": str(knowledge_store.resolve()),
             "active_project_slug": "",
             "active_project_name": "",
-            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "updated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
         }
         save_install_state(install_state)
         success("Saved install state")
@@ -1140,6 +1395,50 @@ class SetupWizard:
         success(f"Workspace ready at {workspace}")
         return True
 
+    def _build_frontend(self, frontend_dir: Path) -> str:
+        """Run npm install + build; returns the failed stage, or "" on success."""
+        install_result = self.run_command(
+            [
+                "npm", "install", "--prefix", str(frontend_dir),
+                "--prefer-offline", "--no-audit", "--no-fund", "--no-progress",
+            ],
+            check=False,
+            timeout=None,
+        )
+        if install_result.returncode != 0:
+            return "install"
+        build_result = self.run_command(
+            ["npm", "run", "build", "--prefix", str(frontend_dir)], check=False, timeout=None
+        )
+        if build_result.returncode != 0:
+            return "build"
+        return ""
+
+    def _report_frontend_build(self):
+        """Wait for the background frontend build and print its outcome."""
+        if self._frontend_build is None:
+            return
+        frontend_dir, future = self._frontend_build
+        self._frontend_build = None
+        if not future.done():
+            info("Waiting for workspace frontend build to finish...")
+        try:
+            failed_stage = future.result()
+        except Exception as e:
+            failed_stage = "install"
+            warning(f"Workspace frontend build errored: {e}")
+        if not failed_stage:
+            success("Workspace frontend built")
+        elif failed_stage == "build":
+            warning("Workspace frontend build failed — you can try later:")
+            console.print(f"  [{DIM}]cd {frontend_dir}[/]")
+            console.print(f"  [{DIM}]npm run build[/]")
+        else:
+            warning("npm install failed — you can try later:")
+            console.print(f"  [{DIM}]cd {frontend_dir}[/]")
+            console.print(f"  [{DIM}]npm install[/]")
+            console.print(f"  [{DIM}]npm run build[/]")
+
     def step_connect_telegram(self) -> bool:
         """Step 9: Start gateway and auto-pair Telegram"""
         step_header(9, "Connect Telegram")
@@ -1171,17 +1470,7 @@ class SetupWizard:
 
         # Start the gateway
         info("Starting OpenClaw gateway...")
-        start_result = self.run_command("openclaw gateway start", check=False)
-        if start_result.returncode != 0:
-            # Try restart in case it's already running
-            self.run_command("openclaw gateway restart", check=False)
-
-        # Give gateway a moment to start
-        time.sleep(3)
-
-        # Verify gateway is running
-        status_result = self.run_command("openclaw gateway status", check=False)
-        if "not running" in status_result.stdout.lower() and "not running" in (status_result.stderr or "").lower():
+        if not self._start_gateway():
             warning("Gateway may not have started — check logs with: openclaw logs --follow")
 
         success("Gateway started")
@@ -1211,8 +1500,9 @@ class SetupWizard:
         if pairing_code:
             info(f"Approving pairing code: {pairing_code}")
             approve_result = self.run_command(
-                f"openclaw pairing approve telegram {pairing_code}",
+                ["openclaw", "pairing", "approve", "telegram", pairing_code],
                 check=False,
+                timeout=30,
             )
             if approve_result.returncode == 0:
                 success("Telegram connected! 🎉")
@@ -1236,6 +1526,7 @@ class SetupWizard:
     def step_done(self):
         """Step 10: Show summary and next steps"""
         step_header(10, "Setup Complete")
+        self._report_frontend_build()
 
         company_name = self.progress.get('company_name', 'N/A')
         tailscale_ip = self.progress.get('tailscale_ip')
@@ -1307,49 +1598,51 @@ class SetupWizard:
         console.print()
 
         # Clean up progress file
-        if self.progress_file.exists():
-            self.progress_file.unlink()
+        self.progress_file.unlink(missing_ok=True)
 
     def run(self):
         """Run the setup wizard"""
-        steps = [
-            ("Welcome", self.step_welcome),
-            ("Prerequisites", self.step_prerequisites),
-            ("AI Provider", self.step_ai_provider),
-            ("Gemini Vision Key", self.step_gemini_key),
-            ("Telegram Bot", self.step_telegram_bot),
-            ("Tailscale", self.step_tailscale),
-            ("Configure OpenClaw", self.step_configure_openclaw),
-            ("Configure Workspace", self.step_configure_maestro),
-            ("Connect Telegram", self.step_connect_telegram),
-        ]
-
-        for step_name, step_func in steps:
-            try:
-                if not step_func():
+        # Re-validate saved credentials up front, in parallel, so resumed
+        # runs don't re-confirm keys that still work.
+        self._verified = self._verify_all_saved()
+
+        try:
+            for step_name, attr in self._STEPS:
+                step_func = getattr(self, attr)
+                try:
+                    if not step_func():
+                        console.print()
+                        error(f"Setup failed at: {step_name}")
+                        console.print(f"  [{DIM}]Progress saved. Run[/] [bold white]maestro setup[/] [{DIM}]again to resume.[/]")
+                        sys.exit(1)
+                except KeyboardInterrupt:
+                    console.print()
+                    warning("Setup interrupted")
+                    console.print(f"  [{DIM}]Progress saved. Run[/] [bold white]maestro setup[/] [{DIM}]again to resume.[/]")
+                    sys.exit(0)
+                except Exception as e:
                     console.print()
-                    error(f"Setup failed at: {step_name}")
+                    error(f"Unexpected error in {step_name}: {e}")
                     console.print(f"  [{DIM}]Progress saved. Run[/] [bold white]maestro setup[/] [{DIM}]again to resume.[/]")
                     sys.exit(1)
-            except KeyboardInterrupt:
-                console.print()
-                warning("Setup interrupted")
-                console.print(f"  [{DIM}]Progress saved. Run[/] [bold white]maestro setup[/] [{DIM}]again to resume.[/]")
-                sys.exit(0)
-            except Exception as e:
-                console.print()
-                error(f"Unexpected error in {step_name}: {e}")
-                console.print(f"  [{DIM}]Progress saved. Run[/] [bold white]maestro setup[/] [{DIM}]again to resume.[/]")
-                sys.exit(1)
+                finally:
+                    self.checkpoint()
 
-        # All steps complete
-        self.step_done()
+            # All steps complete
+            self.step_done()
+        finally:
+            # A later step may exit or raise; still wait for and report the
+            # background frontend build instead of abandoning npm mid-run.
+            self._report_frontend_build()
 
 
-def main():
+def main(recheck: bool = False):
     """Main entry point"""
-    wizard = SetupWizard()
-    wizard.run()
+    wizard = SetupWizard(recheck=recheck)
+    try:
+        wizard.run()
+    finally:
+        wizard.close()
 
 
 if __name__ == '__main__':
@@ -3,18 +3,17 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
 import json
 import os
 import platform
 import subprocess
+import threading
 import time
-from typing import Any
+from typing import Any, Iterator
 
 import httpx
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.table import Table
 
 from .solo_license import load_local_license, save_local_license, verify_solo_license_key
 
@@ -26,7 +25,43 @@ CYAN = "cyan"
 BRIGHT_CYAN = "bright_cyan"
 DIM = "dim"
 
-console = Console()
+
+class _LazyConsole:
+    """Builds the Rich console on first use; `status --json` never imports Rich."""
+
+    _console: Any = None
+
+    def __getattr__(self, name: str) -> Any:
+        if _LazyConsole._console is None:
+            from rich.console import Console
+
+            _LazyConsole._console = Console()
+        return getattr(_LazyConsole._console, name)
+
+
+console = _LazyConsole()
+
+_HTTP: httpx.Client | None = None
+
+
+def _http_client() -> httpx.Client:
+    """Process-wide client so billing/license calls reuse kept-alive connections."""
+    global _HTTP
+    if _HTTP is None:
+        _HTTP = httpx.Client(
+            timeout=20,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        )
+        atexit.register(_HTTP.close)
+    return _HTTP
+
+
+@functools.cache
+def _maestro_main():
+    """Full `maestro` CLI entrypoint, imported on first use only."""
+    from .cli import main
+
+    return main
 
 
 def _open_url(url: str):
@@ -68,7 +103,7 @@ def _license_url(value: str | None) -> str:
 
 def _http_post_json(url: str, payload: dict[str, Any], timeout: int = 20) -> tuple[bool, dict[str, Any]]:
     try:
-        response = httpx.post(url, json=payload, timeout=timeout)
+        response = _http_client().post(url, json=payload, timeout=timeout)
     except Exception as exc:
         return False, {"error": f"http_post_failed: {exc}"}
     try:
@@ -85,7 +120,7 @@ def _http_post_json(url: str, payload: dict[str, Any], timeout: int = 20) -> tup
 
 def _http_get_json(url: str, timeout: int = 20) -> tuple[bool, dict[str, Any]]:
     try:
-        response = httpx.get(url, timeout=timeout)
+        response = _http_client().get(url, timeout=timeout)
     except Exception as exc:
         return False, {"error": f"http_get_failed: {exc}"}
     try:
@@ -100,8 +135,82 @@ def _http_get_json(url: str, timeout: int = 20) -> tuple[bool, dict[str, Any]]:
     return True, data if isinstance(data, dict) else {"result": data}
 
 
+def _warm_connection(url: str) -> threading.Thread:
+    """Fire a background GET so the shared client has a kept-alive connection ready."""
+    def _warm():
+        try:
+            _http_client().get(url, timeout=3)
+        except Exception:
+            pass  # Best effort; the real request reports connection errors.
+
+    thread = threading.Thread(target=_warm, name="maestro-billing-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def _http_stream_status(url: str, deadline: float) -> Iterator[dict[str, Any]]:
+    """Yield purchase payloads pushed over the billing service's event stream.
+
+    Raises on connection errors or non-2xx responses (e.g. an older billing
+    service without the stream endpoint) so callers can fall back to polling.
+    """
+    remaining = max(1, int(deadline - time.time()))
+    timeout = httpx.Timeout(5.0, read=remaining + 5)
+    with _http_client().stream("GET", url, params={"timeout_seconds": remaining}, timeout=timeout) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            try:
+                payload = json.loads(line[len("data:"):])
+            except ValueError:
+                continue
+            if isinstance(payload, dict):
+                yield payload
+
+
+def _apply_purchase_status(polled: dict[str, Any], last_status: str) -> tuple[int | None, str]:
+    """Report a purchase status update; returns (exit code if finished, status)."""
+    from rich.panel import Panel
+
+    status = str(polled.get("status", "")).strip().lower()
+    if status and status != last_status:
+        console.print(f"[{CYAN}]status:[/] {status}")
+
+    if status == "licensed":
+        license_key = str(polled.get("license_key", "")).strip()
+        if not license_key:
+            console.print("[red]Purchase is licensed but license key is empty.[/]")
+            _print_json(polled)
+            return 1, status
+        verify = verify_solo_license_key(license_key)
+        if not bool(verify.get("valid")):
+            console.print("[red]Received invalid license key from billing flow.[/]")
+            _print_json(verify)
+            return 1, status
+        saved = save_local_license(license_key, source="billing_service")
+        console.print(Panel(
+            "\n".join([
+                "License provisioned and saved locally.",
+                f"sku: {saved.get('sku', '')}",
+                f"plan_id: {saved.get('plan_id', '')}",
+                f"expires_at: {saved.get('expires_at', '')}",
+            ]),
+            border_style="green",
+            title="[bold green]Solo License Active[/]",
+        ))
+        return 0, status
+
+    if status in {"failed", "canceled"}:
+        console.print("[red]Purchase did not complete.[/]")
+        _print_json(polled)
+        return 1, status
+
+    return None, status or last_status
+
+
 def _cmd_install(_: argparse.Namespace) -> int:
-    from .cli import main as maestro_main
+    from rich.panel import Panel
 
     console.print(Panel(
         "[white]Launching existing Maestro setup flow[/]\n"
@@ -109,23 +218,29 @@ def _cmd_install(_: argparse.Namespace) -> int:
         border_style=CYAN,
         title=f"[bold {BRIGHT_CYAN}]Maestro Solo Setup[/]",
     ))
-    maestro_main(["setup"])
+    _maestro_main()(["setup"])
     return 0
 
 
 def _cmd_purchase(args: argparse.Namespace) -> int:
+    from rich.panel import Panel
+    from rich.prompt import Prompt
+
+    billing = _billing_url(args.billing_url)
     email = str(args.email or "").strip()
     if not email:
         if bool(getattr(args, "non_interactive", False)):
             console.print("[red]Missing --email in non-interactive mode.[/]")
             return 1
+        # Open the billing connection while the user is typing.
+        warmup = _warm_connection(f"{billing}/healthz")
         email = Prompt.ask("Email for receipt/license").strip()
+        warmup.join(timeout=0.1)
 
     if "@" not in email:
         console.print("[red]Please provide a valid email address.[/]")
         return 1
 
-    billing = _billing_url(args.billing_url)
     payload = {
         "email": email,
         "plan_id": args.plan.strip(),
@@ -186,6 +301,22 @@ def _cmd_purchase(args: argparse.Namespace) -> int:
     console.print("")
     console.print("[bold]Waiting for payment confirmation...[/]")
 
+    # Prefer the pushed event stream; it blocks until the status changes.
+    # Only stream failures fall back to polling; errors applying a status
+    # (license verify/save) propagate.
+    events = _http_stream_status(f"{billing}/v1/solo/purchases/{purchase_id}/events", deadline)
+    while True:
+        try:
+            polled = next(events, None)
+        except httpx.HTTPError:
+            break  # Stream unavailable or dropped; fall back to polling below.
+        if polled is None:
+            break
+        code, last_status = _apply_purchase_status(polled, last_status)
+        if code is not None:
+            events.close()
+            return code
+
     while time.time() < deadline:
         ok, polled = _http_get_json(f"{billing}/v1/solo/purchases/{purchase_id}", timeout=20)
         if not ok:
@@ -194,39 +325,9 @@ def _cmd_purchase(args: argparse.Namespace) -> int:
             time.sleep(poll_seconds)
             continue
 
-        status = str(polled.get("status", "")).strip().lower()
-        if status and status != last_status:
-            console.print(f"[{CYAN}]status:[/] {status}")
-            last_status = status
-
-        if status == "licensed":
-            license_key = str(polled.get("license_key", "")).strip()
-            if not license_key:
-                console.print("[red]Purchase is licensed but license key is empty.[/]")
-                _print_json(polled)
-                return 1
-            verify = verify_solo_license_key(license_key)
-            if not bool(verify.get("valid")):
-                console.print("[red]Received invalid license key from billing flow.[/]")
-                _print_json(verify)
-                return 1
-            saved = save_local_license(license_key, source="billing_service")
-            console.print(Panel(
-                "\n".join([
-                    "License provisioned and saved locally.",
-                    f"sku: {saved.get('sku', '')}",
-                    f"plan_id: {saved.get('plan_id', '')}",
-                    f"expires_at: {saved.get('expires_at', '')}",
-                ]),
-                border_style="green",
-                title="[bold green]Solo License Active[/]",
-            ))
-            return 0
-
-        if status in {"failed", "canceled"}:
-            console.print("[red]Purchase did not complete.[/]")
-            _print_json(polled)
-            return 1
+        code, last_status = _apply_purchase_status(polled, last_status)
+        if code is not None:
+            return code
 
         time.sleep(poll_seconds)
 
@@ -242,59 +343,78 @@ def _cmd_purchase(args: argparse.Namespace) -> int:
     return 1
 
 
-def _cmd_status(args: argparse.Namespace) -> int:
-    local = load_local_license()
-    if not local:
-        console.print(Panel(
-            "No local Solo license found.\n"
-            "Run: [bold white]maestro-solo purchase[/]",
-            border_style="yellow",
-            title="[bold yellow]License Missing[/]",
-        ))
-        return 1
+_STATUS_FIELDS = ("sku", "plan_id", "purchase_id", "email", "issued_at", "expires_at", "error")
 
-    key = str(local.get("license_key", "")).strip()
+
+def _status_payload(key: str, args: argparse.Namespace) -> dict[str, Any]:
+    # verify_solo_license_key already returns string fields; no re-coercion needed.
     verify = verify_solo_license_key(key)
     payload: dict[str, Any] = {
         "local_license_present": True,
         "local_valid": bool(verify.get("valid")),
-        "sku": str(verify.get("sku", "")),
-        "plan_id": str(verify.get("plan_id", "")),
-        "purchase_id": str(verify.get("purchase_id", "")),
-        "email": str(verify.get("email", "")),
-        "issued_at": str(verify.get("issued_at", "")),
-        "expires_at": str(verify.get("expires_at", "")),
-        "error": str(verify.get("error", "")),
     }
+    for field in _STATUS_FIELDS:
+        payload[field] = verify.get(field, "")
 
     if args.remote_verify:
         url = f"{_license_url(args.license_url)}/v1/licenses/solo/verify"
         ok, remote = _http_post_json(url, {"license_key": key}, timeout=20)
         payload["remote_verify_ok"] = ok
         payload["remote_verify"] = remote
+    return payload
+
+
+def _status_json(key: str, args: argparse.Namespace) -> int:
+    payload = _status_payload(key, args)
+    _print_json(payload)
+    return 0 if payload["local_valid"] else 1
+
+
+def _status_pretty(key: str, args: argparse.Namespace) -> int:
+    from rich.panel import Panel
+    from rich.table import Table
+
+    payload = _status_payload(key, args)
+    table = Table(show_header=False, box=None, padding=(0, 1))
+    table.add_row("local_valid", str(payload["local_valid"]))
+    table.add_row("plan_id", str(payload["plan_id"]))
+    table.add_row("purchase_id", str(payload["purchase_id"]))
+    table.add_row("email", str(payload["email"]))
+    table.add_row("expires_at", str(payload["expires_at"]))
+    if payload["error"]:
+        table.add_row("error", str(payload["error"]))
+    if "remote_verify_ok" in payload:
+        table.add_row("remote_verify_ok", str(payload["remote_verify_ok"]))
+    console.print(Panel(
+        table,
+        border_style="green" if bool(payload["local_valid"]) else "yellow",
+        title="[bold bright_cyan]Maestro Solo License Status[/]",
+    ))
+    return 0 if payload["local_valid"] else 1
+
+
+def _cmd_status(args: argparse.Namespace) -> int:
+    local = load_local_license()
+    if not local:
+        from rich.panel import Panel
 
-    if args.json:
-        _print_json(payload)
-    else:
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_row("local_valid", str(payload["local_valid"]))
-        table.add_row("plan_id", str(payload["plan_id"]))
-        table.add_row("purchase_id", str(payload["purchase_id"]))
-        table.add_row("email", str(payload["email"]))
-        table.add_row("expires_at", str(payload["expires_at"]))
-        if payload["error"]:
-            table.add_row("error", str(payload["error"]))
-        if "remote_verify_ok" in payload:
-            table.add_row("remote_verify_ok", str(payload["remote_verify_ok"]))
         console.print(Panel(
-            table,
-            border_style="green" if bool(payload["local_valid"]) else "yellow",
-            title="[bold bright_cyan]Maestro Solo License Status[/]",
+            "No local Solo license found.\n"
+            "Run: [bold white]maestro-solo purchase[/]",
+            border_style="yellow",
+            title="[bold yellow]License Missing[/]",
         ))
-    return 0 if bool(payload.get("local_valid")) else 1
+        return 1
+
+    key = str(local.get("license_key", "")).strip()
+    if args.json:
+        return _status_json(key, args)
+    return _status_pretty(key, args)
 
 
 def _cmd_up(args: argparse.Namespace) -> int:
+    from rich.panel import Panel
+
     local = load_local_license()
     key = str(local.get("license_key", "")).strip()
     verify = verify_solo_license_key(key)
@@ -324,9 +444,7 @@ def _cmd_up(args: argparse.Namespace) -> int:
     if args.field_access_required:
         passthrough.append("--field-access-required")
 
-    from .cli import main as maestro_main
-
-    maestro_main(passthrough)
+    _maestro_main()(passthrough)
     return 0
 
 
@@ -6,12 +6,13 @@ rules) managed under the fleet store root.
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from uuid import uuid4
+from typing import Any, Iterable
 
-from .utils import load_json, save_json
+from .utils import load_json, save_json_atomic
 
 
 DIRECTIVES_VERSION = 1
@@ -20,23 +21,59 @@ STATUS_ACTIVE = "active"
 STATUS_SUPERSEDED = "superseded"
 STATUS_ARCHIVED = "archived"
 VALID_STATUSES = {STATUS_DRAFT, STATUS_ACTIVE, STATUS_SUPERSEDED, STATUS_ARCHIVED}
+_ALL_STATUSES = frozenset(VALID_STATUSES)
+_UNARCHIVED_STATUSES = _ALL_STATUSES - {STATUS_ARCHIVED}
+_ACTIVE_STATUSES = frozenset({STATUS_ACTIVE})
+
+# Normalized docs keyed by store file, valid while (st_ino, st_mtime_ns, st_size) match.
+_DOC_CACHE: dict[Path, tuple[tuple[int, int, int], dict[str, Any]]] = {}
+
+
+# Last (epoch second, ISO string) pair; timestamps only have second precision.
+_NOW_CACHE: tuple[int, str] = (-1, "")
 
 
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    global _NOW_CACHE
+    second = int(time.time())
+    if second == _NOW_CACHE[0]:
+        return _NOW_CACHE[1]
+    from datetime import datetime, timezone
+
+    stamp = datetime.fromtimestamp(second, timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+    _NOW_CACHE = (second, stamp)
+    return stamp
+
+
+@lru_cache(maxsize=128)
+def _resolved_cc_dir(store_root: str) -> Path:
+    return Path(store_root).resolve() / ".command_center"
+
+
+def _command_center_dir(store_root: Path) -> Path:
+    root = Path(store_root)
+    if not root.is_absolute():
+        # Relative roots depend on the cwd, so they are not cacheable.
+        return root.resolve() / ".command_center"
+    return _resolved_cc_dir(str(root))
 
 
 def directives_store_path(store_root: Path) -> Path:
-    return Path(store_root).resolve() / ".command_center" / "system_directives.json"
+    return _command_center_dir(store_root) / "system_directives.json"
 
 
 def legacy_directives_path(store_root: Path) -> Path:
-    return Path(store_root).resolve() / ".command_center" / "directives.json"
+    return _command_center_dir(store_root) / "directives.json"
+
+
+# Maps each status to the module constant itself, so normalized docs share
+# the interned constant objects and equality checks short-circuit on identity.
+_CANONICAL_STATUS = {status: status for status in VALID_STATUSES}
 
 
 def _normalize_status(value: Any) -> str:
-    raw = str(value).strip().lower() if isinstance(value, str) else ""
-    return raw if raw in VALID_STATUSES else STATUS_ACTIVE
+    raw = value.strip().lower() if isinstance(value, str) else ""
+    return _CANONICAL_STATUS.get(raw, STATUS_ACTIVE)
 
 
 def _normalize_priority(value: Any) -> int:
@@ -65,16 +102,19 @@ def _normalize_tags(value: Any) -> list[str]:
     return tags
 
 
-def normalize_directive(raw: dict[str, Any]) -> dict[str, Any]:
-    now = _now_iso()
-    directive_id = str(raw.get("id", "")).strip() or f"DIR-{uuid4().hex[:8]}"
+def normalize_directive(raw: dict[str, Any], *, now: str | None = None) -> dict[str, Any]:
+    directive_id = str(raw.get("id", "")).strip()
+    if not directive_id:
+        from uuid import uuid4  # only needed when minting a new id
+
+        directive_id = f"DIR-{uuid4().hex[:8]}"
     title = str(raw.get("title", "")).strip() or directive_id
     body = str(raw.get("body", "")).strip()
     if not body:
         body = str(raw.get("command", "")).strip()
     status = _normalize_status(raw.get("status"))
     scope = _normalize_scope(raw.get("scope"))
-    updated_at = str(raw.get("updated_at", "")).strip() or now
+    updated_at = str(raw.get("updated_at", "")).strip() or now or _now_iso()
     created_at = str(raw.get("created_at", "")).strip() or updated_at
     version = max(1, int(raw.get("version", 1) or 1))
     return {
@@ -93,21 +133,92 @@ def normalize_directive(raw: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _normalize_doc(payload: dict[str, Any]) -> dict[str, Any]:
-    directives_raw = payload.get("directives", []) if isinstance(payload.get("directives"), list) else []
-    directives = [normalize_directive(item) for item in directives_raw if isinstance(item, dict)]
+_DIRECTIVE_KEYS = frozenset({
+    "id", "title", "body", "scope", "priority", "status", "tags",
+    "effective_at", "created_at", "updated_at", "updated_by", "version",
+})
+
+
+# Text fields normalize_directive strips, and whether it allows them empty.
+_DIRECTIVE_TEXT_FIELDS = (
+    ("id", False), ("title", False), ("body", True), ("scope", False),
+    ("effective_at", True), ("created_at", False), ("updated_at", False),
+    ("updated_by", False),
+)
+
+
+def _clean_text(value: Any, *, allow_empty: bool) -> bool:
+    return type(value) is str and value == value.strip() and (allow_empty or bool(value))
+
+
+def _already_normalized(item: Any) -> bool:
+    """True when normalize_directive would return ``item`` unchanged.
+
+    Checks every invariant normalize_directive enforces, so hand-edited files
+    (out-of-range priority, padded ids, non-string tags...) still go through it.
+    """
+    if not isinstance(item, dict) or item.keys() != _DIRECTIVE_KEYS:
+        return False
+    priority, version, tags = item["priority"], item["version"], item["tags"]
+    return (
+        type(priority) is int
+        and 0 <= priority <= 100
+        and type(version) is int
+        and version >= 1
+        and item["status"] in _CANONICAL_STATUS
+        and type(tags) is list
+        and all(_clean_text(tag, allow_empty=False) for tag in tags)
+        and all(_clean_text(item[key], allow_empty=allow_empty) for key, allow_empty in _DIRECTIVE_TEXT_FIELDS)
+    )
+
+
+def _normalize_doc(payload: dict[str, Any], *, now: str | None = None) -> dict[str, Any]:
+    raw = payload.get("directives")
+    directives_raw = raw if isinstance(raw, list) else ()
+    if payload.get("version") == DIRECTIVES_VERSION and all(map(_already_normalized, directives_raw)):
+        # Steady state: the file was written by this module. Only swap in the
+        # canonical status constants instead of rebuilding every entry.
+        directives = list(directives_raw)
+        for item in directives:
+            item["status"] = _CANONICAL_STATUS[item["status"]]
+    else:
+        directives = [normalize_directive(item, now=now) for item in directives_raw if isinstance(item, dict)]
     return {
         "version": DIRECTIVES_VERSION,
-        "updated_at": str(payload.get("updated_at", "")).strip() or _now_iso(),
+        "updated_at": str(payload.get("updated_at", "")).strip() or now or _now_iso(),
         "directives": directives,
     }
 
 
+def _copy_doc(doc: dict[str, Any]) -> dict[str, Any]:
+    """Copy a normalized doc; tags is the only nested mutable field, so no deepcopy."""
+    return {
+        **doc,
+        "directives": [{**item, "tags": list(item["tags"])} for item in doc["directives"]],
+    }
+
+
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    # Saves replace the file, so a new inode flags a rewrite with equal mtime and size.
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
 def load_system_directives(store_root: Path) -> dict[str, Any]:
     path = directives_store_path(store_root)
-    payload = load_json(path, default={})
+    key = _stat_key(path)
+    cached = _DOC_CACHE.get(path)
+    if key is not None and cached is not None and cached[0] == key:
+        return _copy_doc(cached[1])
+
+    payload = load_json(path, default={}) if key is not None else {}
     if isinstance(payload, dict) and isinstance(payload.get("directives"), list):
-        return _normalize_doc(payload)
+        doc = _normalize_doc(payload)
+        _DOC_CACHE[path] = (key, _copy_doc(doc))
+        return doc
 
     # Legacy fallback: .command_center/directives.json
     legacy = load_json(legacy_directives_path(store_root), default={})
@@ -120,51 +231,73 @@ def load_system_directives(store_root: Path) -> dict[str, Any]:
     return _normalize_doc({"directives": items})
 
 
-def save_system_directives(store_root: Path, doc: dict[str, Any]) -> dict[str, Any]:
-    normalized = _normalize_doc(doc)
-    normalized["updated_at"] = _now_iso()
-    save_json(directives_store_path(store_root), normalized)
+def _wrap_doc(directives: list[dict[str, Any]], *, now: str | None = None) -> dict[str, Any]:
+    """Doc envelope around directives that are already normalized."""
+    return {
+        "version": DIRECTIVES_VERSION,
+        "updated_at": now or _now_iso(),
+        "directives": directives,
+    }
+
+
+def save_system_directives(
+    store_root: Path,
+    doc: dict[str, Any],
+    *,
+    now: str | None = None,
+    _trusted: bool = False,
+) -> dict[str, Any]:
+    # _trusted: every entry in doc["directives"] came from normalize_directive.
+    now = now or _now_iso()
+    if _trusted:
+        normalized = _wrap_doc(doc["directives"], now=now)
+    else:
+        normalized = _normalize_doc(doc, now=now)
+        normalized["updated_at"] = now
+    path = directives_store_path(store_root)
+    save_json_atomic(path, normalized, fsync=True)
+    key = _stat_key(path)
+    if key is not None:
+        _DOC_CACHE[path] = (key, _copy_doc(normalized))
     return normalized
 
 
+def _directive_sort_key(item: dict[str, Any]) -> tuple[int, str, str]:
+    return (-item["priority"], item["updated_at"], item["id"])
+
+
+def _sorted_directives(store_root: Path, *, statuses: frozenset[str]) -> list[dict[str, Any]]:
+    """Filter by status and sort in one pass over the loaded doc."""
+    # Loaded directives are normalized: priority is an int, updated_at/id are strings.
+    items = [item for item in load_system_directives(store_root)["directives"] if item["status"] in statuses]
+    items.sort(key=_directive_sort_key)
+    return items
+
+
 def list_system_directives(
     store_root: Path,
     *,
     include_archived: bool = False,
 ) -> list[dict[str, Any]]:
-    doc = load_system_directives(store_root)
-    directives = doc.get("directives", []) if isinstance(doc.get("directives"), list) else []
-    items = [item for item in directives if isinstance(item, dict)]
-    if not include_archived:
-        items = [item for item in items if str(item.get("status", "")).lower() != STATUS_ARCHIVED]
-    return sorted(
-        items,
-        key=lambda item: (
-            -int(item.get("priority", 0) or 0),
-            str(item.get("updated_at", "")),
-            str(item.get("id", "")),
-        ),
+    return _sorted_directives(
+        store_root,
+        statuses=_ALL_STATUSES if include_archived else _UNARCHIVED_STATUSES,
     )
 
 
 def list_active_directive_feed(store_root: Path) -> list[dict[str, Any]]:
-    items = [
-        item
-        for item in list_system_directives(store_root, include_archived=False)
-        if str(item.get("status", "")).lower() == STATUS_ACTIVE
+    return [
+        {
+            "id": item["id"],
+            "title": item["title"],
+            "command": item["body"],
+            "status": item["status"],
+            "scope": item["scope"],
+            "priority": item["priority"] or 50,
+            "timestamp": item["updated_at"],
+        }
+        for item in _sorted_directives(store_root, statuses=_ACTIVE_STATUSES)
     ]
-    feed: list[dict[str, Any]] = []
-    for item in items:
-        feed.append({
-            "id": item.get("id", ""),
-            "title": item.get("title", ""),
-            "command": item.get("body", ""),
-            "status": item.get("status", STATUS_ACTIVE),
-            "scope": item.get("scope", "global"),
-            "priority": int(item.get("priority", 50) or 50),
-            "timestamp": item.get("updated_at", ""),
-        })
-    return feed
 
 
 def upsert_system_directive(
@@ -173,47 +306,56 @@ def upsert_system_directive(
     *,
     updated_by: str = "system",
 ) -> dict[str, Any]:
-    if not isinstance(directive, dict):
-        raise ValueError("directive payload must be an object")
-
-    doc = load_system_directives(store_root)
-    directives = doc.get("directives", []) if isinstance(doc.get("directives"), list) else []
-    normalized = normalize_directive({
-        **directive,
-        "updated_by": updated_by,
-        "updated_at": _now_iso(),
-    })
-    target_id = str(normalized.get("id", "")).strip()
-
-    replaced = False
-    out: list[dict[str, Any]] = []
-    for item in directives:
-        if not isinstance(item, dict):
-            continue
-        if str(item.get("id", "")).strip() == target_id:
-            merged = normalize_directive({
-                **item,
-                **normalized,
-                "version": int(item.get("version", 1) or 1) + 1,
-            })
-            out.append(merged)
-            normalized = merged
-            replaced = True
-        else:
-            out.append(normalize_directive(item))
-    if not replaced:
-        out.append(normalized)
-
-    saved = save_system_directives(store_root, {"directives": out})
+    batch = upsert_system_directives_batch(store_root, [directive], updated_by=updated_by)
+    result = batch["results"][0]
     return {
         "ok": True,
-        "directive": normalized,
-        "created": not replaced,
-        "updated": replaced,
-        "count": len(saved.get("directives", [])),
+        "directive": result["directive"],
+        "created": result["created"],
+        "updated": result["updated"],
+        "count": batch["count"],
     }
 
 
+def upsert_system_directives_batch(
+    store_root: Path,
+    directives: Iterable[dict[str, Any]],
+    *,
+    updated_by: str = "system",
+) -> dict[str, Any]:
+    """Apply many upserts with a single load and a single save."""
+    now = _now_iso()
+    # Loaded entries are already normalized; only incoming directives are.
+    current = load_system_directives(store_root)["directives"]
+    by_id = {item["id"]: index for index, item in enumerate(current)}
+    results: list[dict[str, Any]] = []
+
+    for directive in directives:
+        if not isinstance(directive, dict):
+            raise ValueError("directive payload must be an object")
+        incoming = directive.copy()
+        incoming["updated_by"] = updated_by
+        incoming["updated_at"] = now
+        normalized = normalize_directive(incoming, now=now)
+
+        index = by_id.get(normalized["id"])
+        if index is None:
+            by_id[normalized["id"]] = len(current)
+            current.append(normalized)
+        else:
+            existing = current[index]
+            merged_src = existing.copy()
+            merged_src.update(normalized)
+            merged_src["version"] = int(existing.get("version", 1) or 1) + 1
+            normalized = normalize_directive(merged_src, now=now)
+            current[index] = normalized
+        results.append({"directive": normalized, "created": index is None, "updated": index is not None})
+
+    if results:
+        save_system_directives(store_root, {"directives": current}, now=now, _trusted=True)
+    return {"ok": True, "results": results, "count": len(current)}
+
+
 def archive_system_directive(
     store_root: Path,
     directive_id: str,
@@ -224,50 +366,36 @@ def archive_system_directive(
     if not target:
         raise ValueError("directive_id is required")
 
-    doc = load_system_directives(store_root)
-    directives = doc.get("directives", []) if isinstance(doc.get("directives"), list) else []
-    found = False
-    archived: dict[str, Any] | None = None
-    out: list[dict[str, Any]] = []
-
-    for item in directives:
-        if not isinstance(item, dict):
-            continue
-        current = normalize_directive(item)
-        if str(current.get("id", "")).strip() == target:
-            found = True
-            current = normalize_directive({
-                **current,
-                "status": STATUS_ARCHIVED,
-                "updated_by": updated_by,
-                "updated_at": _now_iso(),
-                "version": int(current.get("version", 1) or 1) + 1,
-            })
-            archived = current
-        out.append(current)
-
-    if not found:
+    now = _now_iso()
+    # Loaded entries are already normalized; only the archived one is rebuilt.
+    directives = load_system_directives(store_root)["directives"]
+    by_id = {item["id"]: index for index, item in enumerate(directives)}
+    index = by_id.get(target)
+    if index is None:
         return {"ok": False, "error": f"Directive '{target}' not found"}
 
-    save_system_directives(store_root, {"directives": out})
+    current = directives[index]
+    current.update(
+        status=STATUS_ARCHIVED,
+        updated_by=updated_by,
+        updated_at=now,
+        version=int(current.get("version", 1) or 1) + 1,
+    )
+    archived = normalize_directive(current, now=now)
+    directives[index] = archived
+
+    save_system_directives(store_root, {"directives": directives}, now=now, _trusted=True)
     return {"ok": True, "directive": archived}
 
 
 def summarize_system_directives(store_root: Path) -> dict[str, Any]:
-    directives = list_system_directives(store_root, include_archived=True)
-    by_status: dict[str, int] = {
-        STATUS_DRAFT: 0,
-        STATUS_ACTIVE: 0,
-        STATUS_SUPERSEDED: 0,
-        STATUS_ARCHIVED: 0,
-    }
-    for item in directives:
-        status = _normalize_status(item.get("status"))
-        by_status[status] = by_status.get(status, 0) + 1
+    directives = load_system_directives(store_root)["directives"]
+    # Statuses are normalized at load; count them in C.
+    counts = Counter(item["status"] for item in directives)
     return {
         "total": len(directives),
-        "active": by_status.get(STATUS_ACTIVE, 0),
-        "draft": by_status.get(STATUS_DRAFT, 0),
-        "superseded": by_status.get(STATUS_SUPERSEDED, 0),
-        "archived": by_status.get(STATUS_ARCHIVED, 0),
+        "active": counts[STATUS_ACTIVE],
+        "draft": counts[STATUS_DRAFT],
+        "superseded": counts[STATUS_SUPERSEDED],
+        "archived": counts[STATUS_ARCHIVED],
     }
@@ -15,10 +15,13 @@ Usage (Python):
 
 from __future__ import annotations
 
+import base64
 import functools
 import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -38,7 +41,7 @@ from .utils import (
     load_json,
     normalize_bbox,
     parse_json_list,
-    save_json,
+    save_json_atomic,
     slugify_underscore,
 )
 
@@ -144,6 +147,15 @@ def _safe_float(value: Any, default: float = 0.0) -> float:
         return default
 
 
+_SCHEDULE_TOKEN_TRANS = str.maketrans({"-": "_", " ": "_"})
+
+
+@functools.lru_cache(maxsize=256)
+def _schedule_token(text: str) -> str:
+    # Status/type strings repeat constantly across schedule items; normalize each once.
+    return text.strip().lower().translate(_SCHEDULE_TOKEN_TRANS)
+
+
 def _iso_now() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
@@ -334,21 +346,112 @@ def _classify_page_alignment(page_name: str, summary: str, discipline: str, quer
     }
 
 
+def _stat_key(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    # The inode catches an atomic replace that keeps the same mtime and size.
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _read_files(paths: list[Path]) -> list[bytes]:
+    """Read files concurrently, returning their bytes in input order."""
+    if len(paths) < 2:
+        return [path.read_bytes() for path in paths]
+    with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as pool:
+        return list(pool.map(Path.read_bytes, paths))
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleItem:
+    """One normalized managed-schedule item, as held in the schedule cache."""
+
+    id: str
+    title: str
+    type: str
+    status: str
+    due_date: str
+    owner: str
+    activity_id: str
+    impact: str
+    notes: str
+    created_at: str
+    updated_at: str
+    closed_at: str
+    close_reason: str
+
+    def to_dict(self) -> dict[str, str]:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "type": self.type,
+            "status": self.status,
+            "due_date": self.due_date,
+            "owner": self.owner,
+            "activity_id": self.activity_id,
+            "impact": self.impact,
+            "notes": self.notes,
+            "description": self.notes,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "closed_at": self.closed_at,
+            "close_reason": self.close_reason,
+        }
+
+
+def _schedule_sort_key(item: ScheduleItem) -> tuple[str, str, str]:
+    return (item.due_date or "9999-12-31", item.updated_at, item.id)
+
+
+def _schedule_to_dict(schedule: dict[str, Any]) -> dict[str, Any]:
+    # Cached items are frozen, so every caller gets fresh, mutable dicts.
+    return {
+        "version": schedule["version"],
+        "updated_at": schedule["updated_at"],
+        "items": [item.to_dict() for item in schedule["items"]],
+    }
+
+
 def _derive_schedule_variance_days(current_update: dict[str, Any]) -> int:
-    activity_updates = current_update.get("activity_updates") if isinstance(current_update.get("activity_updates"), list) else []
-    delays: list[int] = []
-    for act in activity_updates:
-        if not isinstance(act, dict):
-            continue
-        raw = act.get("variance_days")
-        if raw is None:
-            continue
-        val = _safe_int(raw, 0)
-        # Source schedule files often use positive days as delayed.
-        if val > 0:
-            val = -val
-        delays.append(val)
-    return min(delays) if delays else 0
+    activity_updates = current_update.get("activity_updates")
+    if not isinstance(activity_updates, list):
+        return 0
+    # Source schedule files often use positive days as delayed, so every
+    # variance counts as a slip: the worst one is the most negative.
+    return min(
+        (
+            -abs(_safe_int(act["variance_days"], 0))
+            for act in activity_updates
+            if isinstance(act, dict) and act.get("variance_days") is not None
+        ),
+        default=0,
+    )
+
+
+# ── Environment ──────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=8)
+def _load_env_once(workspace_root: str | None, cwd: str) -> None:
+    # cwd is part of the key because load_dotenv falls back to ./.env.
+    load_dotenv(Path(workspace_root) if workspace_root else None)
+
+
+@functools.lru_cache(maxsize=8)
+def _company_role_cached(
+    workspace_root: str | None,
+    cwd: str,
+    role_env: str | None,
+    workspace_env: str | None,
+) -> bool:
+    # Keyed on every input resolve_agent_role reads besides the .env contents.
+    return is_company_role(Path(workspace_root) if workspace_root else None)
+
+
+def reload_env() -> None:
+    """Forget cached .env loading and role detection (e.g. after editing .env)."""
+    _load_env_once.cache_clear()
+    _company_role_cached.cache_clear()
 
 
 # ── Project Access Guard ──────────────────────────────────────────────────────
@@ -382,15 +485,22 @@ class MaestroTools:
         self._project_name = project_name
         self._workspace_root = self._infer_workspace_root(workspace_root)
         self._project: dict[str, Any] | None = None
+        self._schedule_cache: tuple[tuple[Path, tuple[int, int, int]], dict[str, Any]] | None = None
+        self._page_resolve_cache: tuple[dict[str, Any], dict[str, dict[str, Any] | None]] | None = None
+        self._workspace_index_cache: tuple[tuple[Path, tuple[int, int, int]], list[dict[str, Any]]] | None = None
+        self._gemini: tuple[str, Any] | None = None
         self.licensed = True
         
         # Load environment variables
-        if workspace_root:
-            load_dotenv(workspace_root)
-        else:
-            load_dotenv()
-
-        if is_company_role(self._workspace_root):
+        cwd = os.getcwd()
+        _load_env_once(str(workspace_root) if workspace_root else None, cwd)
+
+        if _company_role_cached(
+            str(self._workspace_root) if self._workspace_root else None,
+            cwd,
+            os.environ.get("MAESTRO_AGENT_ROLE"),
+            os.environ.get("MAESTRO_WORKSPACE"),
+        ):
             raise RuntimeError(
                 "Company Maestro is control-plane only. "
                 "Project knowledge tools are disabled in this workspace."
@@ -424,29 +534,70 @@ class MaestroTools:
                 raise RuntimeError("No project loaded. Run: maestro ingest <folder>")
         return self._project
 
+    def reload_project(self):
+        """Drop the loaded project and everything derived from it."""
+        self._project = None
+        self._page_resolve_cache = None
+        for attr in (
+            "_gaps",
+            "_cross_refs",
+            "_pages_soa",
+            "_exact_index_keys",
+            "_project_dir_path",
+            "_schedule_dir_path",
+            "_workspaces_dir_path",
+        ):
+            self.__dict__.pop(attr, None)
+
     def _resolve_page(self, page_name: str) -> dict[str, Any] | None:
-        return resolve_page(self.project, page_name)
+        project = self.project
+        if self._page_resolve_cache is None or self._page_resolve_cache[0] is not project:
+            self._page_resolve_cache = (project, {})
+        resolved = self._page_resolve_cache[1]
+        if page_name not in resolved:
+            resolved[page_name] = resolve_page(project, page_name)
+        return resolved[page_name]
 
     @staticmethod
     def _normalize_schedule_type(value: Any, default: str = "activity") -> str:
-        raw = str(value or "").strip().lower().replace("-", "_").replace(" ", "_")
+        raw = _schedule_token(value if isinstance(value, str) else str(value or ""))
         return raw if raw in SCHEDULE_ITEM_TYPES else default
 
     @staticmethod
     def _normalize_schedule_status(value: Any, default: str = "pending") -> str:
-        raw = str(value or "").strip().lower().replace("-", "_").replace(" ", "_")
+        raw = _schedule_token(value if isinstance(value, str) else str(value or ""))
         return raw if raw in SCHEDULE_ITEM_STATUSES else default
 
     @staticmethod
     def _text(value: Any) -> str:
         return str(value).strip() if value is not None else ""
 
-    def _project_dir(self) -> Path:
+    @functools.cached_property
+    def _project_dir_path(self) -> Path:
         project_path = self.project.get("_dir")
         if isinstance(project_path, str) and project_path.strip():
             return Path(project_path)
         return self._store_path / str(self.project.get("name", "default"))
 
+    @functools.cached_property
+    def _schedule_dir_path(self) -> Path:
+        schedule_dir = self._project_dir_path / "schedule"
+        schedule_dir.mkdir(parents=True, exist_ok=True)
+        return schedule_dir
+
+    @functools.cached_property
+    def _workspaces_dir_path(self) -> Path:
+        project_path = self.project.get("_dir")
+        if project_path:
+            ws_dir = Path(project_path) / "workspaces"
+        else:
+            ws_dir = self._store_path / self.project.get("name", "default") / "workspaces"
+        ws_dir.mkdir(exist_ok=True)
+        return ws_dir
+
+    def _project_dir(self) -> Path:
+        return self._project_dir_path
+
     def _workspace_route_path(self) -> str:
         workspace_root = self._workspace_root
         if workspace_root and is_company_role(workspace_root):
@@ -462,71 +613,95 @@ class MaestroTools:
         return "/workspace"
 
     def _schedule_dir(self) -> Path:
-        schedule_dir = self._project_dir() / "schedule"
-        schedule_dir.mkdir(parents=True, exist_ok=True)
-        return schedule_dir
+        return self._schedule_dir_path
 
     def _managed_schedule_path(self) -> Path:
         return self._schedule_dir() / MANAGED_SCHEDULE_FILE
 
     def _load_managed_schedule(self) -> dict[str, Any]:
+        return self._load_managed_schedule_indexed()[0]
+
+    def _load_managed_schedule_indexed(self) -> tuple[dict[str, Any], dict[str, int]]:
+        """Load the managed schedule plus an item id -> list position map."""
+        schedule = self._managed_schedule_snapshot()
+        return _schedule_to_dict(schedule), schedule["id_index"]
+
+    def _managed_schedule_snapshot(self) -> dict[str, Any]:
+        """Return the normalized (frozen) managed schedule, re-read only when the file changes."""
         path = self._managed_schedule_path()
-        payload = load_json(path)
+        key = _stat_key(path)
+        cached = self._schedule_cache
+        if key is not None and cached is not None and cached[0] == (path, key):
+            return cached[1]
+        schedule = self._normalize_managed_schedule(load_json(path))
+        if key is not None:
+            self._schedule_cache = ((path, key), schedule)
+        return schedule
+
+    def _normalize_managed_schedule(self, payload: Any) -> dict[str, Any]:
         if not isinstance(payload, dict):
             payload = {}
         items = payload.get("items")
         if not isinstance(items, list):
             items = []
 
-        normalized_items: list[dict[str, Any]] = []
+        text = self._text
+        normalized_items: list[ScheduleItem] = []
         for item in items:
             if not isinstance(item, dict):
                 continue
-            item_id = slugify_underscore(self._text(item.get("id")))
+            item_id = slugify_underscore(text(item.get("id")))
             if not item_id:
                 continue
-            notes = self._text(item.get("notes") or item.get("description"))
-            normalized_items.append({
-                "id": item_id,
-                "title": self._text(item.get("title")),
-                "type": self._normalize_schedule_type(item.get("type")),
-                "status": self._normalize_schedule_status(item.get("status")),
-                "due_date": self._text(item.get("due_date")),
-                "owner": self._text(item.get("owner")),
-                "activity_id": self._text(item.get("activity_id")),
-                "impact": self._text(item.get("impact")),
-                "notes": notes,
-                "description": notes,
-                "created_at": self._text(item.get("created_at")),
-                "updated_at": self._text(item.get("updated_at")),
-                "closed_at": self._text(item.get("closed_at")),
-                "close_reason": self._text(item.get("close_reason")),
-            })
+            normalized_items.append(ScheduleItem(
+                id=item_id,
+                title=text(item.get("title")),
+                type=self._normalize_schedule_type(item.get("type")),
+                status=self._normalize_schedule_status(item.get("status")),
+                due_date=text(item.get("due_date")),
+                owner=text(item.get("owner")),
+                activity_id=text(item.get("activity_id")),
+                impact=text(item.get("impact")),
+                notes=text(item.get("notes") or item.get("description")),
+                created_at=text(item.get("created_at")),
+                updated_at=text(item.get("updated_at")),
+                closed_at=text(item.get("closed_at")),
+                close_reason=text(item.get("close_reason")),
+            ))
+
+        # First occurrence wins on duplicate ids, matching the old linear scans.
+        id_index: dict[str, int] = {}
+        for position, schedule_item in enumerate(normalized_items):
+            id_index.setdefault(schedule_item.id, position)
+
+        # Listing order is fixed per file version, so sort once here instead of per read.
+        sorted_positions = tuple(
+            sorted(range(len(normalized_items)), key=lambda position: _schedule_sort_key(normalized_items[position]))
+        )
+        status_positions: dict[str, list[int]] = {}
+        for position in sorted_positions:
+            status_positions.setdefault(normalized_items[position].status, []).append(position)
 
         return {
             "version": _safe_int(payload.get("version"), 1),
             "updated_at": self._text(payload.get("updated_at")),
-            "items": normalized_items,
+            "items": tuple(normalized_items),
+            "id_index": id_index,
+            "sorted_positions": sorted_positions,
+            "status_positions": {status: tuple(positions) for status, positions in status_positions.items()},
         }
 
-    def _save_managed_schedule(self, payload: dict[str, Any]):
+    def _save_managed_schedule(self, payload: dict[str, Any], *, now: str | None = None):
         data = {
             "version": _safe_int(payload.get("version"), 1),
-            "updated_at": _iso_now(),
+            "updated_at": now or _iso_now(),
             "items": payload.get("items", []),
         }
-        save_json(self._managed_schedule_path(), data)
-
-    @staticmethod
-    def _sort_schedule_items(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        def _key(item: dict[str, Any]) -> tuple[str, str, str]:
-            return (
-                str(item.get("due_date", "") or "9999-12-31"),
-                str(item.get("updated_at", "") or ""),
-                str(item.get("id", "") or ""),
-            )
-
-        return sorted(items, key=_key)
+        path = self._managed_schedule_path()
+        save_json_atomic(path, data)
+        # Prime the cache with what a reload would produce, minus the parse.
+        key = _stat_key(path)
+        self._schedule_cache = ((path, key), self._normalize_managed_schedule(data)) if key is not None else None
 
     @staticmethod
     def _parse_schedule_day(value: Any) -> date | None:
@@ -574,15 +749,17 @@ class MaestroTools:
     def _month_label(day: date) -> str:
         return f"{day:%B} {day.year}"
 
-    def _build_schedule_summary(self, current_update: dict[str, Any], lookahead: dict[str, Any], managed_items: list[dict[str, Any]]) -> str:
-        percent_complete = _safe_int(current_update.get("percent_complete"), 0)
-        spi = _safe_float(current_update.get("schedule_performance_index"), 1.0)
-        variance_days = _derive_schedule_variance_days(current_update)
-        blockers = sum(1 for item in managed_items if item.get("status") == "blocked")
-        constraints = len(lookahead.get("constraints", [])) if isinstance(lookahead.get("constraints"), list) else 0
+    @staticmethod
+    def _build_schedule_summary(
+        percent_complete: int,
+        spi: float,
+        variance_days: int,
+        blocker_count: int,
+        constraint_count: int,
+    ) -> str:
         return (
             f"{percent_complete}% complete · SPI {spi:.2f} · variance {variance_days}d · "
-            f"managed blockers {blockers} · lookahead constraints {constraints}"
+            f"managed blockers {blocker_count} · lookahead constraints {constraint_count}"
         )
 
     # ── Knowledge Queries ─────────────────────────────────────────────────────
@@ -593,18 +770,20 @@ class MaestroTools:
 
     @requires_license
     def list_pages(self, discipline: str | None = None) -> list[dict[str, Any]]:
-        pages = []
-        for name, page in self.project.get("pages", {}).items():
-            page_disc = str(page.get("discipline", ""))
-            if discipline and page_disc.lower() != discipline.lower():
-                continue
-            pages.append({
-                "name": name,
-                "type": page.get("page_type", "unknown"),
-                "discipline": page_disc,
-                "region_count": len(page.get("regions", [])),
-            })
-        return sorted(pages, key=lambda p: p["name"].lower())
+        soa = self._pages_soa
+        rows = soa["by_discipline"].get(discipline.lower(), []) if discipline else soa["name_order"]
+        names, page_types, disciplines, region_counts = (
+            soa["names"], soa["page_types"], soa["disciplines"], soa["region_counts"]
+        )
+        return [
+            {
+                "name": names[row],
+                "type": page_types[row],
+                "discipline": disciplines[row],
+                "region_count": region_counts[row],
+            }
+            for row in rows
+        ]
 
     @requires_license
     def get_sheet_summary(self, page_name: str) -> str:
@@ -983,8 +1162,49 @@ class MaestroTools:
             "snippets": snippets,
         }
 
+    @functools.cached_property
+    def _exact_index_keys(self) -> dict[str, list[tuple[str, str, list[Any]]]]:
+        """Lowercased material/keyword -> [(type, original key, sources)]."""
+        keys: dict[str, list[tuple[str, str, list[Any]]]] = {}
+        idx = self.project.get("index", {}) if isinstance(self.project.get("index", {}), dict) else {}
+        for kind, bucket in (("material", "materials"), ("keyword", "keywords")):
+            entries = idx.get(bucket, {})
+            if not isinstance(entries, dict):
+                continue
+            for key, sources in entries.items():
+                text = str(key)
+                keys.setdefault(text.strip().lower(), []).append((kind, text, sources if isinstance(sources, list) else []))
+        return keys
+
+    def _exact_index_hits(self, query: str) -> list[dict[str, Any]]:
+        full_query, query_terms = _query_terms(query)
+        if not full_query:
+            return []
+        return [
+            {
+                "type": kind,
+                "match": text,
+                "strength": _match_strength(text, full_query, query_terms),
+                "matched_terms": list(query_terms),
+                "found_in": sources,
+                "deep": False,
+            }
+            for kind, text, sources in self._exact_index_keys.get(full_query, [])
+        ]
+
     @requires_license
-    def search(self, query: str) -> list[dict[str, Any]] | str:
+    def search(self, query: str, *, deep: bool = False) -> list[dict[str, Any]] | str:
+        """Search the project index and page content.
+
+        A query that names a material or keyword exactly returns those index
+        hits straight away, each marked ``"deep": False`` so callers can tell
+        the scan was skipped; pass ``deep=True`` to always run the full
+        reflection/pointer scan as well.
+        """
+        if not deep:
+            exact = self._exact_index_hits(query)
+            if exact:
+                return exact
         query_lower, _, ranked_pages, evidence = self._score_pages_for_query(query)
         if not query_lower:
             return "Search query is required"
@@ -1279,16 +1499,20 @@ class MaestroTools:
             "gaps": gaps,
         }
 
+    @functools.cached_property
+    def _cross_refs(self) -> dict[str, list[Any]]:
+        idx = self.project.get("index", {})
+        cross_refs = idx.get("cross_refs", {}) if isinstance(idx, dict) else {}
+        return cross_refs if isinstance(cross_refs, dict) else {}
+
     @requires_license
     def find_cross_references(self, page_name: str) -> dict[str, Any] | str:
-        page = self.project.get("pages", {}).get(page_name)
+        page = self._resolve_page(page_name)
         if not page:
             return f"Page '{page_name}' not found."
-        idx = self.project.get("index", {})
-        cross_refs = idx.get("cross_refs", {}) if isinstance(idx, dict) else {}
         return {
-            "references_from_this_page": page.get("cross_references", []),
-            "pages_that_reference_this": cross_refs.get(page_name, []),
+            "references_from_this_page": list(page.get("cross_references", [])),
+            "pages_that_reference_this": list(self._cross_refs.get(page.get("name", page_name), [])),
         }
 
     @requires_license
@@ -1307,25 +1531,75 @@ class MaestroTools:
 
     @requires_license
     def check_gaps(self) -> list[dict[str, Any]] | str:
+        gaps = self._gaps
+        return [dict(gap) for gap in gaps] if gaps else "No gaps found"
+
+    @functools.cached_property
+    def _gaps(self) -> list[dict[str, Any]]:
         gaps: list[dict[str, Any]] = []
         idx = self.project.get("index", {})
         if isinstance(idx, dict):
             for ref in idx.get("broken_refs", []):
                 gaps.append({"type": "broken_ref", "detail": ref})
-        for page_name, page in self.project.get("pages", {}).items():
-            pointers = page.get("pointers", {})
-            for region in page.get("regions", []):
-                if not isinstance(region, dict):
-                    continue
-                rid = region.get("id", "")
-                if rid and rid not in pointers:
+        soa = self._pages_soa
+        for page_name, regions, region_ids, pointer_ids in zip(
+            soa["names"], soa["regions"], soa["region_ids"], soa["pointer_ids"]
+        ):
+            missing = region_ids - pointer_ids
+            if not missing:
+                continue
+            for rid, label in regions:
+                if rid in missing:
                     gaps.append({
                         "type": "missing_pass2",
                         "page": page_name,
                         "region": rid,
-                        "label": region.get("label", ""),
+                        "label": label,
                     })
-        return gaps if gaps else "No gaps found"
+        return gaps
+
+    @functools.cached_property
+    def _pages_soa(self) -> dict[str, Any]:
+        """Column-wise page table (one list per field, project page order).
+
+        ``name_order`` lists row positions sorted by lowercased page name,
+        ``by_discipline`` maps each lowercased discipline to its rows in that
+        same order, and ``rows`` maps each page name to its row.
+        """
+        soa: dict[str, Any] = {
+            "names": [],
+            "page_types": [],
+            "disciplines": [],
+            "region_counts": [],
+            "regions": [],
+            "region_ids": [],
+            "pointer_ids": [],
+        }
+        for name, page in self.project.get("pages", {}).items():
+            discipline = str(page.get("discipline", ""))
+            raw_regions = page.get("regions", [])
+            regions = [
+                (region.get("id", ""), region.get("label", ""))
+                for region in raw_regions
+                if isinstance(region, dict) and region.get("id", "")
+            ]
+            soa["names"].append(name)
+            soa["page_types"].append(page.get("page_type", "unknown"))
+            soa["disciplines"].append(discipline)
+            soa["region_counts"].append(len(raw_regions))
+            soa["regions"].append(regions)
+            soa["region_ids"].append(frozenset(rid for rid, _label in regions))
+            soa["pointer_ids"].append(frozenset(page.get("pointers", {})))
+
+        names = soa["names"]
+        name_order = sorted(range(len(names)), key=lambda row: names[row].lower())
+        by_discipline: dict[str, list[int]] = {}
+        for row in name_order:
+            by_discipline.setdefault(soa["disciplines"][row].lower(), []).append(row)
+        soa["name_order"] = name_order
+        soa["by_discipline"] = by_discipline
+        soa["rows"] = {name: row for row, name in enumerate(names)}
+        return soa
 
     # ── Schedule Management ───────────────────────────────────────────────────
 
@@ -1346,14 +1620,10 @@ class MaestroTools:
         if not isinstance(baseline, dict):
             baseline = {}
 
-        managed = self._load_managed_schedule()
-        managed_items = managed.get("items", []) if isinstance(managed.get("items"), list) else []
-        status_counts = {status: 0 for status in sorted(SCHEDULE_ITEM_STATUSES)}
-        for item in managed_items:
-            if not isinstance(item, dict):
-                continue
-            status = self._normalize_schedule_status(item.get("status"))
-            status_counts[status] = status_counts.get(status, 0) + 1
+        managed = self._managed_schedule_snapshot()
+        # The snapshot already buckets items by canonical status; no per-item pass needed.
+        status_positions = managed["status_positions"]
+        status_counts = {status: len(status_positions.get(status, ())) for status in sorted(SCHEDULE_ITEM_STATUSES)}
 
         upcoming_critical = current_update.get("upcoming_critical_activities")
         if not isinstance(upcoming_critical, list):
@@ -1361,6 +1631,9 @@ class MaestroTools:
         constraints = lookahead.get("constraints")
         if not isinstance(constraints, list):
             constraints = []
+        variance_days = _derive_schedule_variance_days(current_update)
+        percent_complete = _safe_int(current_update.get("percent_complete"), 0)
+        spi = _safe_float(current_update.get("schedule_performance_index"), 1.0)
 
         return {
             "schedule_root": str(schedule_dir),
@@ -1372,9 +1645,9 @@ class MaestroTools:
             },
             "current": {
                 "data_date": self._text(current_update.get("data_date")),
-                "percent_complete": _safe_int(current_update.get("percent_complete"), 0),
-                "schedule_performance_index": _safe_float(current_update.get("schedule_performance_index"), 1.0),
-                "variance_days": _derive_schedule_variance_days(current_update),
+                "percent_complete": percent_complete,
+                "schedule_performance_index": spi,
+                "variance_days": variance_days,
                 "weather_delays": _safe_int(current_update.get("weather_delays"), 0),
                 "updated_substantial_completion": self._text(current_update.get("updated_substantial_completion")),
                 "updated_final_completion": self._text(current_update.get("updated_final_completion")),
@@ -1396,14 +1669,19 @@ class MaestroTools:
             },
             "managed": {
                 "updated_at": self._text(managed.get("updated_at")),
-                "item_count": len(managed_items),
+                "item_count": len(managed["items"]),
                 "status_counts": status_counts,
                 "active_count": sum(
-                    1 for item in managed_items
-                    if isinstance(item, dict) and self._normalize_schedule_status(item.get("status")) not in CLOSED_SCHEDULE_ITEM_STATUSES
+                    count for status, count in status_counts.items() if status not in CLOSED_SCHEDULE_ITEM_STATUSES
                 ),
             },
-            "summary": self._build_schedule_summary(current_update, lookahead, managed_items),
+            "summary": self._build_schedule_summary(
+                percent_complete,
+                spi,
+                variance_days,
+                status_counts["blocked"],
+                len(constraints),
+            ),
         }
 
     @requires_license
@@ -1413,7 +1691,7 @@ class MaestroTools:
         include_empty_days: bool = True,
     ) -> dict[str, Any] | str:
         payload = self._load_managed_schedule()
-        items = payload.get("items", []) if isinstance(payload.get("items"), list) else []
+        items = payload["items"]
 
         today = datetime.now().date()
         try:
@@ -1431,21 +1709,20 @@ class MaestroTools:
                 cursor += timedelta(days=1)
 
         for item in items:
-            if not isinstance(item, dict):
-                continue
-            due_date = self._text(item.get("due_date"))
+            # Items come back normalized (all string fields, canonical status/type).
+            due_date = item["due_date"]
             day = self._parse_schedule_day(due_date)
             timeline_item = {
-                "id": self._text(item.get("id")),
-                "title": self._text(item.get("title")),
-                "description": self._text(item.get("notes") or item.get("description")),
+                "id": item["id"],
+                "title": item["title"],
+                "description": item["notes"],
                 "date": due_date,
                 "due_date": due_date,
-                "status": self._normalize_schedule_status(item.get("status"), default="pending"),
-                "owner": self._text(item.get("owner")),
-                "type": self._normalize_schedule_type(item.get("type"), default="activity"),
-                "activity_id": self._text(item.get("activity_id")),
-                "updated_at": self._text(item.get("updated_at")),
+                "status": item["status"],
+                "owner": item["owner"],
+                "type": item["type"],
+                "activity_id": item["activity_id"],
+                "updated_at": item["updated_at"],
             }
 
             if day is None:
@@ -1506,21 +1783,16 @@ class MaestroTools:
 
     @requires_license
     def list_schedule_items(self, status: str | None = None) -> list[dict[str, Any]] | str:
-        payload = self._load_managed_schedule()
-        items = payload.get("items", []) if isinstance(payload.get("items"), list) else []
-        target_status = None
+        schedule = self._managed_schedule_snapshot()
+        positions = schedule["sorted_positions"]
         if status is not None:
             normalized = self._normalize_schedule_status(status, default="")
             if not normalized:
                 valid = ", ".join(sorted(SCHEDULE_ITEM_STATUSES))
                 return f"Invalid status '{status}'. Valid statuses: {valid}."
-            target_status = normalized
-        if target_status:
-            items = [
-                item for item in items
-                if isinstance(item, dict) and self._normalize_schedule_status(item.get("status")) == target_status
-            ]
-        return self._sort_schedule_items([item for item in items if isinstance(item, dict)])
+            positions = schedule["status_positions"].get(normalized, ())
+        items = schedule["items"]
+        return [items[position].to_dict() for position in positions]
 
     @requires_license
     def upsert_schedule_item(
@@ -1538,8 +1810,9 @@ class MaestroTools:
         notes: str | None = None,
         description: str | None = None,
     ) -> dict[str, Any] | str:
-        payload = self._load_managed_schedule()
-        items = payload.get("items", []) if isinstance(payload.get("items"), list) else []
+        now = _iso_now()
+        payload, id_index = self._load_managed_schedule_indexed()
+        items = payload["items"]
 
         normalized_id = slugify_underscore(self._text(item_id))
         if not normalized_id:
@@ -1548,11 +1821,8 @@ class MaestroTools:
         if not normalized_id:
             return "item_id or title is required to upsert a schedule item."
 
-        existing = None
-        for item in items:
-            if isinstance(item, dict) and self._text(item.get("id")) == normalized_id:
-                existing = item
-                break
+        position = id_index.get(normalized_id)
+        existing = items[position] if position is not None else None
 
         creating = existing is None
         if creating:
@@ -1569,12 +1839,13 @@ class MaestroTools:
                 "activity_id": "",
                 "impact": "",
                 "notes": "",
-                "created_at": _iso_now(),
-                "updated_at": _iso_now(),
+                "created_at": now,
+                "updated_at": now,
                 "closed_at": "",
                 "close_reason": "",
             }
             items.append(existing)
+        before = None if creating else dict(existing)
 
         if title is not None:
             existing["title"] = self._text(title)
@@ -1606,19 +1877,29 @@ class MaestroTools:
 
         if existing["status"] in CLOSED_SCHEDULE_ITEM_STATUSES:
             if not self._text(existing.get("closed_at")):
-                existing["closed_at"] = _iso_now()
+                existing["closed_at"] = now
         else:
             existing["closed_at"] = ""
             existing["close_reason"] = ""
 
-        existing["updated_at"] = _iso_now()
-        self._save_managed_schedule({"version": payload.get("version", 1), "items": items})
+        if existing == before:
+            # Nothing to persist: skip rewriting the whole schedule file.
+            return {
+                "status": "updated",
+                "changed": False,
+                "item": {**existing, "description": self._text(existing.get("notes"))},
+                "managed_item_count": len(items),
+            }
+
+        existing["updated_at"] = now
+        self._save_managed_schedule({"version": payload.get("version", 1), "items": items}, now=now)
 
         item_payload = {**existing, "description": self._text(existing.get("notes"))}
         return {
             "status": "created" if creating else "updated",
+            "changed": True,
             "item": item_payload,
-            "managed_item_count": len([i for i in items if isinstance(i, dict)]),
+            "managed_item_count": len(items),
         }
 
     @requires_license
@@ -1657,23 +1938,20 @@ class MaestroTools:
         if normalized_status not in CLOSED_SCHEDULE_ITEM_STATUSES:
             return "close status must be one of: done, cancelled."
 
-        payload = self._load_managed_schedule()
-        items = payload.get("items", []) if isinstance(payload.get("items"), list) else []
-
-        target = None
-        for item in items:
-            if isinstance(item, dict) and self._text(item.get("id")) == normalized_id:
-                target = item
-                break
+        payload, id_index = self._load_managed_schedule_indexed()
+        items = payload["items"]
 
-        if not isinstance(target, dict):
+        position = id_index.get(normalized_id)
+        if position is None:
             return f"Schedule item '{normalized_id}' not found."
+        target = items[position]
 
         target["status"] = normalized_status
         target["close_reason"] = self._text(reason)
-        target["closed_at"] = _iso_now()
-        target["updated_at"] = _iso_now()
-        self._save_managed_schedule({"version": payload.get("version", 1), "items": items})
+        now = _iso_now()
+        target["closed_at"] = now
+        target["updated_at"] = now
+        self._save_managed_schedule({"version": payload.get("version", 1), "items": items}, now=now)
         item_payload = {**target, "description": self._text(target.get("notes"))}
         return {
             "status": "closed",
@@ -1683,44 +1961,104 @@ class MaestroTools:
     # ── Workspace Management ──────────────────────────────────────────────────
 
     def _workspaces_dir(self) -> Path:
-        project_path = self.project.get("_dir")
-        if project_path:
-            ws_dir = Path(project_path) / "workspaces"
-        else:
-            ws_dir = self._store_path / self.project.get("name", "default") / "workspaces"
-        ws_dir.mkdir(exist_ok=True)
-        return ws_dir
+        return self._workspaces_dir_path
 
     def _load_workspace(self, slug: str) -> dict[str, Any] | None:
-        ws_path = self._workspaces_dir() / slug / "workspace.json"
-        return load_json(ws_path) if ws_path.exists() else None
+        # A missing or unreadable file loads as {}; no separate exists() probe.
+        return load_json(self._workspaces_dir() / slug / "workspace.json") or None
+
+    @staticmethod
+    def _find_workspace_page(ws: dict[str, Any], page_name: str) -> dict[str, Any] | None:
+        """First workspace page entry named ``page_name``, or None."""
+        return next(
+            (page for page in ws.get("pages", []) if isinstance(page, dict) and page.get("page_name") == page_name),
+            None,
+        )
+
+    def _commit_workspace(self, ws: dict[str, Any]):
+        """Persist a mutated workspace, then its index entry only if that changed.
+
+        Edits that cannot change page/note counts call _save_workspace alone.
+        """
+        self._save_workspace(ws)
+        self._update_index_entry(ws)
 
     def _save_workspace(self, ws: dict[str, Any]):
         slug = ws["slug"]
         ws_dir = self._workspaces_dir() / slug
         ws_dir.mkdir(exist_ok=True)
-        save_json(ws_dir / "workspace.json", ws)
+        # Machine-read only; compact output keeps highlight-heavy files small.
+        save_json_atomic(ws_dir / "workspace.json", ws, indent=None)
 
     def _all_workspaces(self) -> list[dict[str, Any]]:
         ws_dir = self._workspaces_dir()
+        with os.scandir(ws_dir) as it:
+            # DirEntry.is_dir() reuses the type from the directory listing.
+            names = sorted(entry.name for entry in it if entry.is_dir())
         workspaces = []
-        for d in sorted(ws_dir.iterdir()):
-            if d.is_dir():
-                ws = self._load_workspace(d.name)
-                if ws:
-                    workspaces.append(ws)
+        for name in names:
+            ws = self._load_workspace(name)
+            if ws:
+                workspaces.append(ws)
         return workspaces
 
-    def _save_index(self):
-        workspaces = self._all_workspaces()
-        index = [{
+    @staticmethod
+    def _index_entry(ws: dict[str, Any]) -> dict[str, Any]:
+        return {
             "slug": ws["slug"],
             "title": ws.get("title", ""),
             "description": ws.get("description", ""),
             "page_count": len(ws.get("pages", [])),
             "note_count": len(ws.get("notes", [])),
-        } for ws in workspaces]
-        save_json(self._workspaces_dir() / "_index.json", index)
+        }
+
+    def _index_path(self) -> Path:
+        return self._workspaces_dir() / "_index.json"
+
+    def _load_index(self) -> list[dict[str, Any]]:
+        """Return the workspace index, rebuilding it only when missing or unreadable."""
+        path = self._index_path()
+        key = _stat_key(path)
+        cached = self._workspace_index_cache
+        if key is not None and cached is not None and cached[0] == (path, key):
+            return [dict(entry) for entry in cached[1]]
+
+        index = load_json(path, default=None) if key is not None else None
+        if not isinstance(index, list) or not all(isinstance(e, dict) and e.get("slug") for e in index):
+            return self.rebuild_index()
+        self._workspace_index_cache = ((path, key), [dict(entry) for entry in index])
+        return index
+
+    def _write_index(self, index: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        path = self._index_path()
+        save_json_atomic(path, index)
+        key = _stat_key(path)
+        self._workspace_index_cache = ((path, key), [dict(entry) for entry in index]) if key is not None else None
+        return index
+
+    def _update_index_entry(self, ws: dict[str, Any]):
+        entry = self._index_entry(ws)
+        index = self._load_index()
+        for i, existing in enumerate(index):
+            if existing.get("slug") == entry["slug"]:
+                if existing == entry:
+                    return
+                index[i] = entry
+                break
+        else:
+            index.append(entry)
+            index.sort(key=lambda e: e["slug"])
+        self._write_index(index)
+
+    def _remove_index_entry(self, slug: str):
+        index = self._load_index()
+        kept = [entry for entry in index if entry.get("slug") != slug]
+        if len(kept) != len(index):
+            self._write_index(kept)
+
+    def rebuild_index(self) -> list[dict[str, Any]]:
+        """Rescan every workspace on disk and rewrite ``_index.json`` from scratch."""
+        return self._write_index([self._index_entry(ws) for ws in self._all_workspaces()])
 
     @requires_license
     def create_workspace(self, title: str, description: str) -> dict[str, Any] | str:
@@ -1741,19 +2079,12 @@ class MaestroTools:
             "pages": [],
             "notes": [],
         }
-        self._save_workspace(ws)
-        self._save_index()
+        self._commit_workspace(ws)
         return {"status": "created", "slug": slug, "title": ws["title"]}
 
     @requires_license
     def list_workspaces(self) -> list[dict[str, Any]]:
-        return [{
-            "slug": ws["slug"],
-            "title": ws.get("title", ""),
-            "description": ws.get("description", ""),
-            "page_count": len(ws.get("pages", [])),
-            "note_count": len(ws.get("notes", [])),
-        } for ws in self._all_workspaces()]
+        return [self._index_entry(ws) for ws in self._all_workspaces()]
 
     @requires_license
     def get_workspace(self, slug: str) -> dict[str, Any] | str:
@@ -1771,7 +2102,7 @@ class MaestroTools:
         ws_path = self._workspaces_dir() / slug
         if ws_path.exists():
             shutil.rmtree(ws_path)
-        self._save_index()
+        self._remove_index_entry(slug)
         return {
             "status": "deleted",
             "workspace": slug,
@@ -1790,9 +2121,8 @@ class MaestroTools:
             return f"Page '{page_name}' not found in knowledge store."
         resolved_name = page.get("name", page_name)
 
-        for p in ws.get("pages", []):
-            if p.get("page_name") == resolved_name:
-                return f"Page '{resolved_name}' is already in workspace '{slug}'."
+        if self._find_workspace_page(ws, resolved_name):
+            return f"Page '{resolved_name}' is already in workspace '{slug}'."
 
         ws.setdefault("pages", []).append({
             "page_name": resolved_name,
@@ -1800,8 +2130,7 @@ class MaestroTools:
             "selected_pointers": [],
             "highlights": [],
         })
-        self._save_workspace(ws)
-        self._save_index()
+        self._commit_workspace(ws)
         return {"status": "added", "workspace": slug, "page": resolved_name}
 
     @requires_license
@@ -1816,8 +2145,7 @@ class MaestroTools:
             return f"Page '{page_name}' is not in workspace '{slug}'."
 
         ws["pages"] = new_pages
-        self._save_workspace(ws)
-        self._save_index()
+        self._commit_workspace(ws)
         return {"status": "removed", "workspace": slug, "page": page_name}
 
     @requires_license
@@ -1826,42 +2154,39 @@ class MaestroTools:
         if not ws:
             return f"Workspace '{slug}' not found."
 
-        target_page = None
-        for p in ws.get("pages", []):
-            if p.get("page_name") == page_name:
-                target_page = p
-                break
+        target_page = self._find_workspace_page(ws, page_name)
 
         if not target_page:
             page_data = self._resolve_page(page_name)
             if page_data:
                 resolved_name = page_data.get("name", page_name)
-                for p in ws.get("pages", []):
-                    if p.get("page_name") == resolved_name:
-                        target_page = p
-                        page_name = resolved_name
-                        break
+                target_page = self._find_workspace_page(ws, resolved_name)
+                if target_page:
+                    page_name = resolved_name
 
         if not target_page:
             return f"Page '{page_name}' is not in workspace '{slug}'. Add it first with add_page."
 
-        ks_page = self.project.get("pages", {}).get(page_name, {})
-        valid_ids = {r.get("id") for r in ks_page.get("regions", []) if isinstance(r, dict)}
+        soa = self._pages_soa
+        row = soa["rows"].get(page_name)
+        valid_ids = soa["region_ids"][row] if row is not None else frozenset()
 
-        invalid = [pid for pid in pointer_ids if pid not in valid_ids]
+        invalid = set(pointer_ids) - valid_ids
         if invalid:
-            return f"Invalid pointer IDs: {invalid}. Use list_regions to see available pointers."
-
-        existing = set(target_page.get("selected_pointers", []))
-        existing.update(pointer_ids)
-        target_page["selected_pointers"] = sorted(existing)
-
-        self._save_workspace(ws)
+            return f"Invalid pointer IDs: {sorted(invalid)}. Use list_regions to see available pointers."
+
+        existing = target_page.get("selected_pointers", [])
+        # The stored list is already sorted, so this is a merge of two sorted runs
+        # (linear under timsort) rather than a full re-sort.
+        selected = sorted(dict.fromkeys([*existing, *sorted(set(pointer_ids))]))
+        if selected != existing:
+            target_page["selected_pointers"] = selected
+            self._save_workspace(ws)
         return {
             "status": "selected",
             "workspace": slug,
             "page": page_name,
-            "selected_pointers": target_page["selected_pointers"],
+            "selected_pointers": selected,
         }
 
     @requires_license
@@ -1870,25 +2195,22 @@ class MaestroTools:
         if not ws:
             return f"Workspace '{slug}' not found."
 
-        target_page = None
-        for p in ws.get("pages", []):
-            if p.get("page_name") == page_name:
-                target_page = p
-                break
-
+        target_page = self._find_workspace_page(ws, page_name)
         if not target_page:
             return f"Page '{page_name}' is not in workspace '{slug}'."
 
-        existing = set(target_page.get("selected_pointers", []))
-        existing -= set(pointer_ids)
-        target_page["selected_pointers"] = sorted(existing)
-
-        self._save_workspace(ws)
+        existing = target_page.get("selected_pointers", [])
+        removed = set(pointer_ids)
+        # Filtering keeps the stored order, so the sort is a linear pass.
+        selected = sorted(dict.fromkeys(pid for pid in existing if pid not in removed))
+        if selected != existing:
+            target_page["selected_pointers"] = selected
+            self._save_workspace(ws)
         return {
             "status": "deselected",
             "workspace": slug,
             "page": page_name,
-            "selected_pointers": target_page["selected_pointers"],
+            "selected_pointers": selected,
         }
 
     @requires_license
@@ -1905,7 +2227,7 @@ class MaestroTools:
             "created_at": datetime.now(timezone.utc).isoformat(),
         }
         ws.setdefault("notes", []).append(note)
-        self._save_workspace(ws)
+        self._commit_workspace(ws)
         return {"status": "added", "workspace": slug, "note": note}
 
     @requires_license
@@ -1914,16 +2236,33 @@ class MaestroTools:
         if not ws:
             return f"Workspace '{slug}' not found."
 
-        for p in ws.get("pages", []):
-            if p.get("page_name") == page_name:
-                p["description"] = description.strip()
-                self._save_workspace(ws)
-                return {"status": "updated", "workspace": slug, "page": page_name}
-
-        return f"Page '{page_name}' is not in workspace '{slug}'."
+        target_page = self._find_workspace_page(ws, page_name)
+        if not target_page:
+            return f"Page '{page_name}' is not in workspace '{slug}'."
+        target_page["description"] = description.strip()
+        self._save_workspace(ws)
+        return {"status": "updated", "workspace": slug, "page": page_name}
 
     # ── Highlight (Gemini Vision) ─────────────────────────────────────────────
 
+    def _gemini_client(self) -> Any | None:
+        """Return a Gemini client for GEMINI_API_KEY, or None when it is unset.
+
+        A missing key re-reads .env, so a key added mid-session is picked up;
+        the client is reused until the key changes.
+        """
+        api_key = os.environ.get("GEMINI_API_KEY")
+        if not api_key:
+            load_dotenv(self._workspace_root)
+            api_key = os.environ.get("GEMINI_API_KEY")
+        if not api_key:
+            return None
+        if self._gemini is None or self._gemini[0] != api_key:
+            from google import genai
+
+            self._gemini = (api_key, genai.Client(api_key=api_key))
+        return self._gemini[1]
+
     @requires_license
     def highlight(self, slug: str, page_name: str, query: str) -> dict[str, Any] | str:
         ws = self._load_workspace(slug)
@@ -1943,11 +2282,7 @@ class MaestroTools:
             return f"No PNG found at {png_path}."
 
         # Ensure page is in workspace
-        ws_page = None
-        for p in ws.get("pages", []):
-            if p.get("page_name") == resolved_name:
-                ws_page = p
-                break
+        ws_page = self._find_workspace_page(ws, resolved_name)
         if not ws_page:
             ws.setdefault("pages", []).append({
                 "page_name": resolved_name,
@@ -1957,20 +2292,15 @@ class MaestroTools:
             })
             ws_page = ws["pages"][-1]
 
-        if self._workspace_root:
-            load_dotenv(self._workspace_root)
-        else:
-            load_dotenv()
-
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if not api_key:
-            return "GEMINI_API_KEY not set. Set it in .env or environment."
+        # Read the page image while the Gemini client is resolved.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            png_future = pool.submit(png_path.read_bytes)
+            client = self._gemini_client()
+            if client is None:
+                return "GEMINI_API_KEY not set. Set it in .env or environment."
+            from google.genai import types
 
-        from google import genai
-        from google.genai import types
-
-        client = genai.Client(api_key=api_key)
-        png_bytes = png_path.read_bytes()
+            png_bytes = png_future.result()
         prompt = HIGHLIGHT_PROMPT.format(query=query)
 
         response = client.models.generate_content(
@@ -1996,21 +2326,24 @@ class MaestroTools:
             return f"Failed to parse Gemini response: {raw[:500]}"
 
         custom_highlights = []
+        labels = []
         for h in highlights:
             raw_box = h.get("box_2d") or h.get("bbox", [])
             bbox = normalize_bbox(raw_box)
-            if bbox["x1"] <= bbox["x0"] or bbox["y1"] <= bbox["y0"]:
+            x0, y0, x1, y1 = bbox["x0"], bbox["y0"], bbox["x1"], bbox["y1"]
+            if x1 <= x0 or y1 <= y0:
                 continue
+            label = h.get("label", "")
+            labels.append(label)
             custom_highlights.append({
-                "label": h.get("label", ""),
+                "label": label,
                 "bbox": bbox,
                 "query": query,
                 "confidence": h.get("confidence", 0.0),
             })
 
         ws_page.setdefault("custom_highlights", []).extend(custom_highlights)
-        self._save_workspace(ws)
-        self._save_index()
+        self._commit_workspace(ws)
 
         return {
             "status": "highlighted",
@@ -2018,7 +2351,7 @@ class MaestroTools:
             "page": resolved_name,
             "highlights_added": len(custom_highlights),
             "total_highlights": len(ws_page.get("custom_highlights", [])),
-            "labels": [h["label"] for h in custom_highlights],
+            "labels": labels,
         }
 
     @requires_license
@@ -2027,13 +2360,12 @@ class MaestroTools:
         if not ws:
             return f"Workspace '{slug}' not found."
 
-        for p in ws.get("pages", []):
-            if p.get("page_name") == page_name:
-                p["custom_highlights"] = []
-                self._save_workspace(ws)
-                return {"status": "cleared", "workspace": slug, "page": page_name}
-
-        return f"Page '{page_name}' is not in workspace '{slug}'."
+        target_page = self._find_workspace_page(ws, page_name)
+        if not target_page:
+            return f"Page '{page_name}' is not in workspace '{slug}'."
+        target_page["custom_highlights"] = []
+        self._save_workspace(ws)
+        return {"status": "cleared", "workspace": slug, "page": page_name}
 
     # ── Image Generation ──────────────────────────────────────────────────────
 
@@ -2051,39 +2383,34 @@ class MaestroTools:
         if not ws:
             return f"Workspace '{slug}' not found."
 
-        if self._workspace_root:
-            load_dotenv(self._workspace_root)
-        else:
-            load_dotenv()
-
-        api_key = os.environ.get("GEMINI_API_KEY")
-        if not api_key:
+        client = self._gemini_client()
+        if client is None:
             return "GEMINI_API_KEY not set. Set it in .env or environment."
-
-        from google import genai
         from google.genai import types
 
-        client = genai.Client(api_key=api_key)
-        parts = []
+        images: list[tuple[Path, str]] = []
 
         for pn in (reference_pages or []):
             page = self._resolve_page(pn)
             if page:
                 png_path = Path(page["path"]) / "page.png"
                 if png_path.exists():
-                    parts.append(types.Part.from_bytes(
-                        data=png_path.read_bytes(), mime_type="image/png"
-                    ))
+                    images.append((png_path, "image/png"))
 
         if reference_image_path:
             ref_path = Path(reference_image_path)
             if ref_path.exists():
                 suffix = ref_path.suffix.lower()
                 mime = "image/jpeg" if suffix in (".jpg", ".jpeg") else "image/png"
-                parts.append(types.Part.from_bytes(data=ref_path.read_bytes(), mime_type=mime))
+                images.append((ref_path, mime))
             else:
                 return f"Reference image not found: {reference_image_path}"
 
+        image_bytes = _read_files([path for path, _mime in images])
+        parts = [
+            types.Part.from_bytes(data=data, mime_type=mime)
+            for data, (_path, mime) in zip(image_bytes, images)
+        ]
         parts.append(types.Part.from_text(text=prompt))
 
         try:
@@ -2116,18 +2443,16 @@ class MaestroTools:
             desc = " ".join(description_parts).strip()
             return f"No image generated. Response: {desc[:500]}" if desc else "No image generated — empty response."
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        image_filename = f"gen_{timestamp}.png"
+        now = datetime.now(timezone.utc)
+        image_filename = f"gen_{now.strftime('%Y%m%d_%H%M%S')}.png"
 
         img_dir = self._workspaces_dir() / slug / "generated_images"
         img_dir.mkdir(parents=True, exist_ok=True)
         image_path = img_dir / image_filename
 
-        if isinstance(image_data, (bytes, bytearray)):
-            image_path.write_bytes(image_data)
-        else:
-            import base64
-            image_path.write_bytes(base64.b64decode(image_data))
+        if isinstance(image_data, str):
+            image_data = base64.b64decode(image_data)
+        image_path.write_bytes(image_data)
 
         description = " ".join(description_parts).strip()
         gen_entry = {
@@ -2137,11 +2462,10 @@ class MaestroTools:
             "reference_pages": reference_pages or [],
             "description": description,
             "aspect_ratio": aspect_ratio,
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": now.isoformat(),
         }
         ws.setdefault("generated_images", []).append(gen_entry)
-        self._save_workspace(ws)
-        self._save_index()
+        self._commit_workspace(ws)
 
         return {
             "status": "generated",
@@ -2168,8 +2492,7 @@ class MaestroTools:
             return f"Image '{filename}' not found in workspace '{slug}'."
 
         removed = images.pop(found)
-        self._save_workspace(ws)
-        self._save_index()
+        self._commit_workspace(ws)
 
         img_path = self._workspaces_dir() / slug / "generated_images" / filename
         if img_path.exists():
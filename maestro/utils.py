@@ -7,19 +7,31 @@ Canonical implementations live here; no duplication.
 
 from __future__ import annotations
 
+import functools
 import json
+import math
+import os
 import re
+import threading
 from pathlib import Path
 from typing import Any
 
 from .config import BBOX_SCALE
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 
 # ── JSON Parsing ──────────────────────────────────────────────────────────────
 
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+
 def clean_json_string(s: str) -> str:
     """Remove trailing commas before } or ] (common Gemini output artifact)."""
-    return re.sub(r",\s*([}\]])", r"\1", s).strip()
+    return _TRAILING_COMMA_RE.sub(r"\1", s).strip()
 
 
 def parse_json(text: str) -> dict:
@@ -298,29 +310,108 @@ def load_json(path: Path, default: Any = None) -> Any:
     """Safely load a JSON file, returning default on failure."""
     if default is None:
         default = {}
-    if not path.exists():
+    try:
+        # Parse the raw bytes: one read, no separate text-decoding pass.
+        data = path.read_bytes()
+    except Exception:
         return default
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # BOM, NaN/Infinity literals etc. — let the stdlib decide
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json.loads(data)
     except Exception:
         return default
 
 
-def save_json(path: Path, data: Any, indent: int = 2):
+_JSON_SCALAR_TYPES = (str, int, bool, type(None))
+
+
+def _orjson_writes_like_stdlib(data: Any) -> bool:
+    """True when orjson's bytes for ``data`` equal ``json.dumps``'s.
+
+    orjson also serializes Enum, UUID and other non-JSON types the stdlib
+    rejects, writes NaN/Infinity as ``null``, and formats exponent floats
+    differently (``1e16`` vs ``1e+16``, ``0.00001`` vs ``1e-05``). Plain
+    containers, exact scalar types and floats whose repr has no exponent
+    are byte-identical.
+    """
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        kind = type(item)
+        if kind is dict:
+            if any(type(key) is not str for key in item):
+                return False
+            stack.extend(item.values())
+        elif kind is list or kind is tuple:
+            stack.extend(item)
+        elif kind is float:
+            if not math.isfinite(item) or "e" in repr(item):
+                return False
+        elif kind not in _JSON_SCALAR_TYPES:
+            return False
+    return True
+
+
+def dump_json_bytes(data: Any, indent: int | None = 2) -> bytes:
+    """Serialize to UTF-8 bytes; ``indent=None`` means compact separators.
+
+    The output is always what ``json.dumps`` would write (``ensure_ascii=False``).
+    orjson is used when it produces the same bytes; anything else, including
+    ints beyond 64 bits, goes through the stdlib.
+    """
+    if orjson is not None and indent in (2, None) and _orjson_writes_like_stdlib(data):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent == 2 else 0)
+        except TypeError:  # orjson.JSONEncodeError, e.g. ints beyond 64 bits
+            pass
+    if indent is None:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, indent=indent, ensure_ascii=False).encode("utf-8")
+
+
+def save_json(path: Path, data: Any, indent: int | None = 2):
     """Save data as JSON, creating parent directories as needed."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    path.write_bytes(dump_json_bytes(data, indent))
+
+
+def save_json_atomic(path: Path, data: Any, indent: int | None = 2, *, fsync: bool = False):
+    """Like save_json, but readers only ever see the old or the new file.
+
+    With ``fsync=True`` the new contents are flushed to disk before the rename.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Per-writer temp name: concurrent saves of one file (server and CLI,
+    # worker threads) must not clobber or steal each other's temp file.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as handle:
+            handle.write(dump_json_bytes(data, indent))
+            if fsync:
+                handle.flush()
+                os.fsync(handle.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
 
 
 def slugify(text: str) -> str:
     """Convert text to URL-safe slug."""
-    s = re.sub(r"[^a-z0-9]+", "-", text.lower().strip())
+    s = _SLUG_SEPARATOR_RE.sub("-", text.lower().strip())
     return s.strip("-") or "default"
 
 
+@functools.lru_cache(maxsize=4096)
 def slugify_underscore(text: str) -> str:
     """Convert text to underscore-separated slug (for workspace IDs)."""
-    s = re.sub(r"[^a-z0-9]+", "_", text.lower())
-    s = re.sub(r"_+", "_", s).strip("_")
+    # "_" is itself a separator character, so one pass already collapses runs.
+    s = _SLUG_SEPARATOR_RE.sub("_", text.lower()).strip("_")
     return s or "workspace"
@@ -622,7 +622,8 @@ def render_personal_tools_md(active_provider_env_key: str | None = None) -> str:
         "- Do not recursively scan `knowledge_store/` with `grep -R` or `find` for normal Q&A.\n"
         "- Do not dump large JSON files (`pass1.json`, `pass2.json`) into model context.\n"
         "- For row-level highlights, get bbox from image evidence; do not estimate coordinates.\n"
-        "- If a helper command is missing, stay on Maestro tools instead of broad fallback scans.\n\n"
+        "- If a helper command is missing, stay on Maestro tools instead of broad fallback scans.\n"
+        "- CLI `maestro tools search \"<query>\"` stops at exact material/keyword index hits (marked `\"deep\": false`); add `--deep` to also scan sheet reflections and region content.\n\n"
         "## Optional Fleet\n"
         "- Enable enterprise mode when needed: `maestro fleet enable`\n"
         "- Command Center (fleet only): `/command-center`\n\n"
@@ -690,7 +691,8 @@ def render_project_tools_md(active_provider_env_key: str | None = None) -> str:
         "- Use native Maestro tools above before generic shell/file operations.\n"
         "- Do not call browser/web tools for plan discovery, workspace edits, or schedule updates.\n"
         "- Do not recursively scan `knowledge_store/` with `grep -R` or `find` for normal Q&A.\n"
-        "- Do not dump large JSON files (`pass1.json`, `pass2.json`) into context.\n\n"
+        "- Do not dump large JSON files (`pass1.json`, `pass2.json`) into context.\n"
+        "- CLI `maestro tools search \"<query>\"` stops at exact material/keyword index hits (marked `\"deep\": false`); add `--deep` to also scan sheet reflections and region content.\n\n"
         "## Environment Variables\n"
         f"{provider_line}"
         "- `MAESTRO_AGENT_ROLE` — `project`\n"
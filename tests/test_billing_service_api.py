@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import json
+
 from fastapi.testclient import TestClient
 
 from maestro import billing_service
@@ -52,3 +54,30 @@ def test_billing_purchase_and_mark_paid_flow(tmp_path, monkeypatch):
     assert isinstance(licensed_payload["license_key"], str)
     assert licensed_payload["license_key"].startswith("MSOLO.")
 
+
+def test_purchase_event_stream_pushes_terminal_status(tmp_path, monkeypatch):
+    monkeypatch.setenv("MAESTRO_SOLO_HOME", str(tmp_path))
+    monkeypatch.setattr(
+        billing_service,
+        "_issue_license_for_purchase",
+        lambda purchase, timeout_seconds=10: (True, {"license_key": "MSOLO.test"}),
+    )
+
+    client = TestClient(billing_service.app)
+    purchase_id = client.post(
+        "/v1/solo/purchases",
+        json={"email": "super@example.com", "plan_id": "solo_test_monthly"},
+    ).json()["purchase_id"]
+    client.post("/v1/solo/dev/mark-paid", json={"purchase_id": purchase_id})
+
+    with client.stream("GET", f"/v1/solo/purchases/{purchase_id}/events") as response:
+        assert response.status_code == 200
+        events = [line for line in response.iter_lines() if line.startswith("data:")]
+
+    assert len(events) == 1
+    payload = json.loads(events[0][len("data:"):])
+    assert payload["status"] == "licensed"
+    assert payload["license_key"] == "MSOLO.test"
+
+    missing = client.get("/v1/solo/purchases/pur_missing/events")
+    assert missing.status_code == 404
@@ -14,6 +14,8 @@ def test_setup_parser_mode():
     parser = build_parser()
     args = parser.parse_args(["setup"])
     assert args.mode == "setup"
+    assert args.recheck is False
+    assert parser.parse_args(["setup", "--recheck"]).recheck is True
 
 
 def test_ingest_parser_accepts_new_project_name():
@@ -101,6 +101,7 @@ def test_workspace_websocket_initializes(tmp_path: Path):
 
 def test_workspace_event_slug_ignores_index_file():
     assert server._workspace_event_slug(("workspaces", "_index.json")) is None
+    assert server._workspace_event_slug(("workspaces", "_index.json.1234.5678.tmp")) is None
     assert server._workspace_event_slug(("workspaces", "demo-workspace", "workspace.json")) == "demo-workspace"
 
 
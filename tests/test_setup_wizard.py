@@ -0,0 +1,325 @@
+"""Tests for setup wizard steps and helpers."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from maestro import setup_wizard
+from maestro.setup_wizard import (
+    AGENT_FILES,
+    PREREQ_PROBES,
+    SetupWizard,
+    _copy_agent_file,
+    _fast_copy,
+    _index_search_dirs,
+    _write_file_bytes,
+)
+
+
+class _RecordedRun:
+    """Stand-in for SetupWizard.run_command that records each command."""
+
+    def __init__(self):
+        self.calls: list = []
+        self.returncode = 0
+        self.stdout = ""
+        self.stderr = ""
+        self.respond = None
+
+    def __call__(self, cmd) -> subprocess.CompletedProcess:
+        self.calls.append(cmd)
+        if self.respond is not None:
+            return self.respond(cmd)
+        return subprocess.CompletedProcess(cmd, self.returncode, stdout=self.stdout, stderr=self.stderr)
+
+
+@pytest.fixture
+def wizard() -> SetupWizard:
+    Path.home().mkdir(parents=True, exist_ok=True)
+    return SetupWizard()
+
+
+@pytest.fixture
+def recorded_wizard(monkeypatch, wizard) -> tuple[SetupWizard, _RecordedRun]:
+    """A wizard whose run_command records commands instead of running them."""
+    run = _RecordedRun()
+    monkeypatch.setattr(SetupWizard, "run_command", lambda self, cmd, check=True, timeout=5.0: run(cmd))
+    return wizard, run
+
+
+def test_copy_agent_file_uses_first_matching_search_dir(tmp_path: Path):
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    workspace = tmp_path / "workspace"
+    for path in (first, second, workspace):
+        path.mkdir()
+    (first / "SOUL.md").write_text("first soul", encoding="utf-8")
+    (second / "SOUL.md").write_text("second soul", encoding="utf-8")
+
+    result = _copy_agent_file("SOUL.md", _index_search_dirs((first, second)), workspace)
+
+    assert result == ("SOUL.md", True)
+    assert (workspace / "SOUL.md").read_text(encoding="utf-8") == "first soul"
+
+
+def test_fast_copy_overwrites_longer_destination(tmp_path: Path, monkeypatch):
+    src = tmp_path / "IDENTITY.md"
+    dst = tmp_path / "copy.md"
+    src.write_text("short", encoding="utf-8")
+    dst.write_text("a much longer stale body", encoding="utf-8")
+
+    _fast_copy(src, dst)
+    assert dst.read_text(encoding="utf-8") == "short"
+
+    def _no_sendfile(*_args):
+        raise OSError("sendfile unsupported")
+
+    monkeypatch.setattr(setup_wizard.os, "sendfile", _no_sendfile, raising=False)
+    dst.write_text("another long stale body", encoding="utf-8")
+    _fast_copy(src, dst)
+    assert dst.read_text(encoding="utf-8") == "short"
+
+
+def test_copy_agent_file_reports_missing(tmp_path: Path):
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+
+    indexes = _index_search_dirs((tmp_path, tmp_path / "missing"))
+    assert _copy_agent_file("USER.md", indexes, workspace) == ("USER.md", False)
+    assert not (workspace / "USER.md").exists()
+    assert "USER.md" in AGENT_FILES
+
+
+def test_wizard_step_table_resolves_to_methods():
+    for _name, attr in SetupWizard._STEPS:
+        assert callable(getattr(SetupWizard, attr))
+
+
+def test_prerequisites_runs_each_version_probe_once(monkeypatch, recorded_wizard):
+    wizard, run = recorded_wizard
+    run.stdout = "v1.0.0\n"
+    monkeypatch.setattr("maestro.setup_wizard.shutil.which", lambda name: f"/usr/bin/{name}")
+
+    assert wizard.step_prerequisites() is True
+    assert sorted(run.calls) == sorted(cmd for _, cmd in PREREQ_PROBES)
+    assert wizard.progress["prerequisites"] is True
+
+
+def test_run_command_avoids_shell_and_reports_missing_tool(wizard):
+    result = wizard.run_command("maestro-missing-tool-xyz --version", check=False)
+
+    assert result.returncode == 127
+    assert result.stdout == ""
+
+
+def test_progress_is_written_only_on_checkpoint(wizard):
+    wizard.progress["company_name"] = "Acme"
+    wizard.save_progress()
+
+    assert not wizard.progress_file.exists()
+
+    wizard.checkpoint()
+
+    assert json.loads(wizard.progress_file.read_text(encoding="utf-8")) == {"company_name": "Acme"}
+    assert SetupWizard().progress == {"company_name": "Acme"}
+
+
+def test_verify_all_saved_checks_credentials_concurrently(monkeypatch, wizard):
+    wizard.progress.update({
+        "provider": "openai",
+        "provider_key": "sk-good",
+        "gemini_key": "gemini-bad",
+        "telegram_token": "123:good",
+    })
+    seen: list[tuple[str, str]] = []
+
+    def _fake_check(kind, secret):
+        seen.append((kind, secret))
+        if "bad" in secret:
+            return False, None
+        return True, None
+
+    monkeypatch.setattr(wizard, "_check_credential", _fake_check)
+
+    assert wizard._verify_all_saved() == {"provider_key", "telegram_token"}
+    assert sorted(seen) == [("google", "gemini-bad"), ("openai", "sk-good"), ("telegram", "123:good")]
+
+
+def test_verify_all_saved_skips_network_without_saved_credentials(monkeypatch, wizard):
+    monkeypatch.setattr(wizard, "_check_credential", lambda *_: (_ for _ in ()).throw(AssertionError))
+
+    assert wizard._verify_all_saved() == set()
+
+
+def test_prerequisites_skips_version_probe_for_missing_tools(monkeypatch, recorded_wizard):
+    wizard, run = recorded_wizard
+    run.stdout = "v1.0.0\n"
+    monkeypatch.setattr(
+        "maestro.setup_wizard.shutil.which",
+        lambda name: None if name == "git" else f"/usr/bin/{name}",
+    )
+
+    assert wizard.step_prerequisites() is True
+    assert "git --version" not in run.calls
+
+
+def test_prerequisites_uses_cached_result_unless_recheck(monkeypatch, recorded_wizard):
+    wizard, run = recorded_wizard
+    run.stdout = "v1.0.0\n"
+    monkeypatch.setattr("maestro.setup_wizard.shutil.which", lambda name: f"/usr/bin/{name}")
+
+    wizard.progress.update({"prerequisites": True, "os": "Linux"})
+    assert wizard.step_prerequisites() is True
+    assert run.calls == []
+
+    wizard = SetupWizard(recheck=True)
+    wizard.progress.update({"prerequisites": True, "os": "Linux"})
+    assert wizard.step_prerequisites() is True
+    assert len(run.calls) == len(PREREQ_PROBES)
+
+
+def test_load_progress_tolerates_missing_and_corrupt_files(wizard):
+    assert wizard.load_progress() == {}
+
+    wizard.progress_file.write_text("{not json", encoding="utf-8")
+    assert wizard.load_progress() == {}
+
+
+def test_configure_openclaw_merges_config_and_skips_noop_rewrite():
+    home = Path.home()
+    config_file = home / ".openclaw" / "openclaw.json"
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+    config_file.write_text(
+        json.dumps({"agents": {"list": [{"id": "maestro"}, {"id": "other"}]}}),
+        encoding="utf-8",
+    )
+
+    wizard = SetupWizard()
+    wizard.progress.update({
+        "provider_env_key": "GEMINI_API_KEY",
+        "provider_key": "gemini-key",
+        "model": "google/gemini-3-pro-preview",
+    })
+
+    assert wizard.step_configure_openclaw() is True
+    config = json.loads(config_file.read_text(encoding="utf-8"))
+    assert [a["id"] for a in config["agents"]["list"]] == ["other", "maestro-personal"]
+    assert config["env"]["GEMINI_API_KEY"] == "gemini-key"
+    assert not config_file.with_suffix(".json.tmp").exists()
+
+    mtime = config_file.stat().st_mtime_ns
+    assert wizard.step_configure_openclaw() is True
+    assert config_file.stat().st_mtime_ns == mtime
+
+
+def test_run_command_times_out_hung_probe(wizard):
+    result = wizard.run_command([sys.executable, "-c", "import time; time.sleep(5)"], check=False, timeout=0.2)
+
+    assert result.returncode == 124
+
+
+def test_check_openclaw_reuses_recent_result(recorded_wizard):
+    wizard, run = recorded_wizard
+    run.returncode = 1
+
+    wizard._check_openclaw()
+    wizard._check_openclaw()
+    assert run.calls == ["openclaw --version"]
+
+    wizard._oc_last_check = None
+    wizard._check_openclaw()
+    assert len(run.calls) == 2
+
+
+def test_frontend_build_reports_failed_stage(recorded_wizard, tmp_path):
+    wizard, run = recorded_wizard
+    run.respond = lambda cmd: subprocess.CompletedProcess(cmd, 1 if cmd[:2] == ["npm", "run"] else 0, "", "")
+
+    assert wizard._build_frontend(tmp_path) == "build"
+    assert run.calls[0][:4] == ["npm", "install", "--prefix", str(tmp_path)]
+    assert run.calls[1] == ["npm", "run", "build", "--prefix", str(tmp_path)]
+
+
+def test_write_file_bytes_creates_file_with_mode(tmp_path: Path):
+    target = tmp_path / ".env"
+    _write_file_bytes(target, b"KEY=value\n", mode=0o600)
+    _write_file_bytes(target, b"KEY=other\n", mode=0o600)
+
+    assert target.read_bytes() == b"KEY=other\n"
+    if os.name == "posix":
+        assert target.stat().st_mode & 0o777 == 0o600
+
+
+def test_start_gateway_batches_commands_into_one_spawn(monkeypatch, recorded_wizard):
+    wizard, run = recorded_wizard
+    monkeypatch.setattr(setup_wizard, "_wait_ready", lambda probe: True)
+    wizard.is_windows = False
+
+    if not os.path.exists("/bin/sh"):
+        pytest.skip("batched gateway start needs /bin/sh")
+    assert wizard._start_gateway() is True
+    assert len(run.calls) == 1
+    assert run.calls[0][:2] == ["/bin/sh", "-c"]
+
+
+@pytest.mark.parametrize(
+    ("stdout", "stderr", "expected"),
+    [
+        ("Gateway not running\n", "", True),
+        ("", "gateway not running\n", True),
+        ("Gateway not running\n", "error: not running\n", False),
+    ],
+)
+def test_start_gateway_status_needs_not_running_on_both_streams(
+    monkeypatch, recorded_wizard, stdout, stderr, expected
+):
+    wizard, run = recorded_wizard
+    run.stdout, run.stderr = stdout, stderr
+    monkeypatch.setattr(setup_wizard, "_wait_ready", lambda probe: False)
+
+    assert wizard._start_gateway() is expected
+
+
+def test_wait_ready_returns_once_probe_succeeds(monkeypatch):
+    attempts = []
+    sleeps = []
+    monkeypatch.setattr(setup_wizard.time, "sleep", sleeps.append)
+
+    def _probe():
+        attempts.append(1)
+        return len(attempts) >= 3
+
+    assert setup_wizard._wait_ready(_probe, timeout=5.0) is True
+    assert len(attempts) == 3
+    assert sleeps[0] == 0.05
+    assert sleeps[1] > sleeps[0]
+
+
+def test_wait_ready_gives_up_after_timeout():
+    assert setup_wizard._wait_ready(lambda: False, timeout=0.05) is False
+
+
+def test_run_reports_frontend_build_when_a_later_step_fails(monkeypatch, tmp_path: Path, wizard):
+    from concurrent.futures import Future
+
+    monkeypatch.setattr(wizard, "_verify_all_saved", set)
+    monkeypatch.setattr(wizard, "_STEPS", (("Failing step", "_failing_step"),), raising=False)
+    wizard._failing_step = lambda: False
+    build: Future = Future()
+    build.set_result("build")
+    wizard._frontend_build = (tmp_path, build)
+    warnings = []
+    monkeypatch.setattr(setup_wizard, "warning", warnings.append)
+
+    with pytest.raises(SystemExit):
+        wizard.run()
+
+    assert wizard._frontend_build is None
+    assert warnings == ["Workspace frontend build failed — you can try later:"]
+
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import json
+
 import pytest
 
 from maestro import solo_cli
-from maestro.solo_license import issue_solo_license, load_local_license
+from maestro.solo_license import issue_solo_license, load_local_license, save_local_license
 
 
 def _run_cli(argv: list[str]) -> int:
@@ -20,6 +22,21 @@ def test_solo_status_without_license_returns_error(tmp_path, monkeypatch):
     assert code == 1
 
 
+def test_solo_status_json_prints_license_payload(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("MAESTRO_SOLO_HOME", str(tmp_path))
+    issued = issue_solo_license(purchase_id="pur_json", plan_id="solo_test_monthly", email="json@example.com")
+    save_local_license(issued["license_key"], home_dir=tmp_path)
+
+    code = _run_cli(["status", "--json"])
+    assert code == 0
+
+    payload = json.loads(capsys.readouterr().out)
+    assert payload["local_valid"] is True
+    assert payload["purchase_id"] == "pur_json"
+    assert payload["email"] == "json@example.com"
+    assert payload["error"] == ""
+
+
 def test_solo_purchase_polls_until_licensed_and_saves_local_license(tmp_path, monkeypatch):
     monkeypatch.setenv("MAESTRO_SOLO_HOME", str(tmp_path))
     monkeypatch.setattr(solo_cli, "_open_url", lambda *_: None)
@@ -48,8 +65,13 @@ def test_solo_purchase_polls_until_licensed_and_saves_local_license(tmp_path, mo
             return True, poll_responses.pop(0)
         return True, {"status": "licensed", "license_key": issued["license_key"]}
 
+    class _NoStreamClient:
+        def stream(self, *_args, **_kwargs):
+            raise solo_cli.httpx.ConnectError("event stream unavailable")
+
     monkeypatch.setattr(solo_cli, "_http_post_json", _fake_post)
     monkeypatch.setattr(solo_cli, "_http_get_json", _fake_get)
+    monkeypatch.setattr(solo_cli, "_http_client", lambda: _NoStreamClient())
 
     code = _run_cli([
         "purchase",
@@ -67,3 +89,70 @@ def test_solo_purchase_polls_until_licensed_and_saves_local_license(tmp_path, mo
     assert saved["plan_id"] == "solo_test_monthly"
     assert saved["license_key"] == issued["license_key"]
 
+
+def test_solo_purchase_uses_event_stream_without_polling(tmp_path, monkeypatch):
+    monkeypatch.setenv("MAESTRO_SOLO_HOME", str(tmp_path))
+    monkeypatch.setattr(solo_cli, "_open_url", lambda *_: None)
+
+    issued = issue_solo_license(
+        purchase_id="pur_cli_002",
+        plan_id="solo_test_monthly",
+        email="cli@example.com",
+    )
+
+    def _fake_post(url: str, payload: dict, timeout: int = 20):
+        return True, {
+            "purchase_id": "pur_cli_002",
+            "status": "pending",
+            "checkout_url": "http://localhost/checkout/pur_cli_002",
+        }
+
+    def _fake_stream(url: str, deadline: float):
+        assert url.endswith("/v1/solo/purchases/pur_cli_002/events")
+        yield {"status": "pending"}
+        yield {"status": "licensed", "license_key": issued["license_key"]}
+
+    def _fail_get(url: str, timeout: int = 20):
+        raise AssertionError("polling should not run when the stream delivers a result")
+
+    monkeypatch.setattr(solo_cli, "_http_post_json", _fake_post)
+    monkeypatch.setattr(solo_cli, "_http_stream_status", _fake_stream)
+    monkeypatch.setattr(solo_cli, "_http_get_json", _fail_get)
+
+    code = _run_cli(["purchase", "--email", "cli@example.com", "--no-open"])
+    assert code == 0
+    assert load_local_license(home_dir=tmp_path)["license_key"] == issued["license_key"]
+
+
+def test_solo_purchase_stream_does_not_swallow_license_save_errors(tmp_path, monkeypatch):
+    monkeypatch.setenv("MAESTRO_SOLO_HOME", str(tmp_path))
+    monkeypatch.setattr(solo_cli, "_open_url", lambda *_: None)
+
+    issued = issue_solo_license(purchase_id="pur_cli_003", plan_id="solo_test_monthly", email="cli@example.com")
+
+    def _fake_post(url: str, payload: dict, timeout: int = 20):
+        return True, {"purchase_id": "pur_cli_003", "status": "pending", "checkout_url": "http://localhost/checkout"}
+
+    def _fake_stream(url: str, deadline: float):
+        yield {"status": "licensed", "license_key": issued["license_key"]}
+
+    def _fail_save(*_args, **_kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(solo_cli, "_http_post_json", _fake_post)
+    monkeypatch.setattr(solo_cli, "_http_stream_status", _fake_stream)
+    monkeypatch.setattr(solo_cli, "save_local_license", _fail_save)
+
+    with pytest.raises(OSError, match="disk full"):
+        solo_cli.main(["purchase", "--email", "cli@example.com", "--no-open"])
+
+
+def test_warm_connection_swallows_connection_errors(monkeypatch):
+    class _FailingClient:
+        def get(self, *_args, **_kwargs):
+            raise solo_cli.httpx.ConnectError("billing down")
+
+    monkeypatch.setattr(solo_cli, "_http_client", lambda: _FailingClient())
+    thread = solo_cli._warm_connection("http://127.0.0.1:9/healthz")
+    thread.join(timeout=2)
+    assert not thread.is_alive()
@@ -7,9 +7,13 @@ from pathlib import Path
 
 from maestro.system_directives import (
     archive_system_directive,
+    directives_store_path,
+    legacy_directives_path,
     list_active_directive_feed,
     list_system_directives,
+    summarize_system_directives,
     upsert_system_directive,
+    upsert_system_directives_batch,
 )
 
 
@@ -83,3 +87,231 @@ def test_legacy_directives_fallback(tmp_path: Path):
     feed = list_active_directive_feed(tmp_path)
     assert len(feed) == 1
     assert feed[0]["id"] == "DIR-LEG"
+
+
+def test_store_paths_resolve_relative_roots_against_cwd(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert directives_store_path(Path("store")) == tmp_path.resolve() / "store" / ".command_center" / "system_directives.json"
+    assert directives_store_path(tmp_path) == directives_store_path(tmp_path)
+    assert legacy_directives_path(tmp_path).name == "directives.json"
+
+
+def test_load_reuses_cached_doc_until_file_changes(tmp_path: Path, monkeypatch):
+    from maestro import system_directives
+
+    upsert_system_directive(tmp_path, {"id": "DIR-C", "title": "Cached", "body": "One", "status": "active"})
+
+    reads = []
+    real_load_json = system_directives.load_json
+    monkeypatch.setattr(
+        system_directives,
+        "load_json",
+        lambda path, **kw: reads.append(path) or real_load_json(path, **kw),
+    )
+
+    first = list_system_directives(tmp_path)
+    first[0]["title"] = "mutated by caller"
+    assert list_system_directives(tmp_path)[0]["title"] == "Cached"
+    assert reads == []
+
+    _write_json(
+        directives_store_path(tmp_path),
+        {"version": 1, "directives": [{"id": "DIR-C", "title": "Edited on disk", "body": "Two"}]},
+    )
+    assert list_system_directives(tmp_path)[0]["title"] == "Edited on disk"
+    assert len(reads) == 1
+
+
+def test_store_round_trips_without_orjson(tmp_path: Path, monkeypatch):
+    from maestro import system_directives, utils
+
+    monkeypatch.setattr(utils, "orjson", None)
+    upsert_system_directive(tmp_path, {"id": "DIR-J", "title": "Ünïcode", "body": "Stdlib path"})
+
+    raw = json.loads(directives_store_path(tmp_path).read_text(encoding="utf-8"))
+    assert raw["directives"][0]["title"] == "Ünïcode"
+    system_directives._DOC_CACHE.clear()
+    assert list_system_directives(tmp_path)[0]["body"] == "Stdlib path"
+
+
+def test_save_replaces_store_atomically(tmp_path: Path):
+    upsert_system_directive(tmp_path, {"id": "DIR-1", "title": "First", "body": "One"})
+    upsert_system_directive(tmp_path, {"id": "DIR-2", "title": "Second", "body": "Two"})
+
+    store = directives_store_path(tmp_path)
+    assert [path.name for path in store.parent.iterdir()] == [store.name]
+    raw = json.loads(store.read_text(encoding="utf-8"))
+    assert [item["id"] for item in raw["directives"]] == ["DIR-1", "DIR-2"]
+
+
+def test_archive_touches_only_the_target_directive(tmp_path: Path):
+    upsert_system_directive(tmp_path, {"id": "DIR-KEEP", "title": "Keep", "body": "Stay active"})
+    upsert_system_directive(tmp_path, {"id": "DIR-GO", "title": "Go", "body": "Archive me"})
+    before = {item["id"]: item for item in list_system_directives(tmp_path)}
+
+    archived = archive_system_directive(tmp_path, "DIR-GO", updated_by="tester")
+    assert archived["directive"]["version"] == before["DIR-GO"]["version"] + 1
+    assert archive_system_directive(tmp_path, "DIR-MISSING") == {
+        "ok": False,
+        "error": "Directive 'DIR-MISSING' not found",
+    }
+
+    after = {item["id"]: item for item in list_system_directives(tmp_path, include_archived=True)}
+    assert after["DIR-KEEP"] == before["DIR-KEEP"]
+    assert after["DIR-GO"]["status"] == "archived"
+
+
+def test_upsert_stamps_one_timestamp_per_operation(tmp_path: Path, monkeypatch):
+    from maestro import system_directives
+
+    upsert_system_directive(tmp_path, {"id": "DIR-OLD", "title": "Existing", "body": "Already stored"})
+    calls = []
+    monkeypatch.setattr(system_directives, "_now_iso", lambda: calls.append(1) or "2026-01-01T00:00:00Z")
+
+    result = upsert_system_directive(tmp_path, {"id": "DIR-T", "title": "Timed", "body": "Once"})
+    assert result["directive"]["updated_at"] == "2026-01-01T00:00:00Z"
+    assert len(calls) == 1
+
+
+def test_list_orders_by_priority_then_updated_at_then_id(tmp_path: Path):
+    _write_json(
+        directives_store_path(tmp_path),
+        {
+            "version": 1,
+            "directives": [
+                {"id": "DIR-B", "title": "B", "body": "b", "priority": 50, "updated_at": "2026-01-02T00:00:00Z"},
+                {"id": "DIR-A", "title": "A", "body": "a", "priority": 50, "updated_at": "2026-01-02T00:00:00Z"},
+                {"id": "DIR-OLD", "title": "Old", "body": "o", "priority": 50, "updated_at": "2026-01-01T00:00:00Z"},
+                {"id": "DIR-TOP", "title": "Top", "body": "t", "priority": "95", "updated_at": "2026-01-03T00:00:00Z"},
+            ],
+        },
+    )
+    ids = [item["id"] for item in list_system_directives(tmp_path)]
+    assert ids == ["DIR-TOP", "DIR-OLD", "DIR-A", "DIR-B"]
+
+
+def test_cached_doc_is_isolated_from_caller_mutation(tmp_path: Path):
+    upsert_system_directive(tmp_path, {"id": "DIR-TAG", "title": "Tags", "body": "b", "tags": ["ppe"]})
+
+    listed = list_system_directives(tmp_path)
+    listed[0]["tags"].append("leaked")
+    listed.clear()
+
+    again = list_system_directives(tmp_path)
+    assert [item["id"] for item in again] == ["DIR-TAG"]
+    assert again[0]["tags"] == ["ppe"]
+
+
+def test_load_skips_renormalizing_current_version_entries(tmp_path: Path, monkeypatch):
+    from maestro import system_directives
+
+    upsert_system_directive(tmp_path, {"id": "DIR-FAST", "title": "Fast", "body": "Stored"})
+    system_directives._DOC_CACHE.clear()
+
+    calls = []
+    real_normalize = system_directives.normalize_directive
+    monkeypatch.setattr(
+        system_directives,
+        "normalize_directive",
+        lambda raw, **kwargs: calls.append(raw) or real_normalize(raw, **kwargs),
+    )
+    directives = list_system_directives(tmp_path)
+    assert [item["id"] for item in directives] == ["DIR-FAST"]
+    assert directives[0]["status"] is system_directives.STATUS_ACTIVE
+    assert calls == []
+
+    # A hand-edited entry with a missing field takes the full normalization path.
+    _write_json(
+        directives_store_path(tmp_path),
+        {"version": 1, "directives": [{"id": "DIR-HAND", "title": "Hand", "body": "Edited", "priority": "70"}]},
+    )
+    assert list_system_directives(tmp_path)[0]["priority"] == 70
+    assert len(calls) == 1
+
+
+def test_load_renormalizes_full_shape_entries_that_break_invariants(tmp_path: Path):
+    from maestro import system_directives
+
+    upsert_system_directive(tmp_path, {"id": "DIR-OK", "title": "Fine", "body": "Stored"})
+    stored = json.loads(directives_store_path(tmp_path).read_text(encoding="utf-8"))
+    template = stored["directives"][0]
+    edits = [
+        {"priority": 500},
+        {"id": " DIR-PAD "},
+        {"version": 0},
+        {"tags": [" ppe ", 7]},
+        {"title": 12},
+    ]
+    for edit in edits:
+        _write_json(directives_store_path(tmp_path), {**stored, "directives": [{**template, **edit}]})
+        system_directives._DOC_CACHE.clear()
+        item = list_system_directives(tmp_path)[0]
+        assert item == system_directives.normalize_directive({**template, **edit})
+        assert item != {**template, **edit}
+
+
+def test_summarize_counts_each_status(tmp_path: Path):
+    upsert_system_directive(tmp_path, {"id": "DIR-1", "title": "One", "body": "a", "status": "active"})
+    upsert_system_directive(tmp_path, {"id": "DIR-2", "title": "Two", "body": "b", "status": "draft"})
+    upsert_system_directive(tmp_path, {"id": "DIR-3", "title": "Three", "body": "c", "status": "active"})
+    archive_system_directive(tmp_path, "DIR-3")
+
+    assert summarize_system_directives(tmp_path) == {
+        "total": 3,
+        "active": 1,
+        "draft": 1,
+        "superseded": 0,
+        "archived": 1,
+    }
+
+
+def test_now_iso_reuses_string_within_the_same_second(monkeypatch):
+    from maestro import system_directives
+
+    clock = [1767225600.2]
+    monkeypatch.setattr(system_directives.time, "time", lambda: clock[0])
+    monkeypatch.setattr(system_directives, "_NOW_CACHE", (-1, ""))
+
+    first = system_directives._now_iso()
+    clock[0] = 1767225600.9
+    assert system_directives._now_iso() is first
+    assert first == "2026-01-01T00:00:00Z"
+
+    clock[0] = 1767225601.0
+    assert system_directives._now_iso() == "2026-01-01T00:00:01Z"
+
+
+def test_batch_upsert_loads_and_saves_once(tmp_path: Path, monkeypatch):
+    from maestro import system_directives
+
+    upsert_system_directive(tmp_path, {"id": "DIR-1", "title": "One", "body": "v1"})
+    writes = []
+    real_write = system_directives.save_json_atomic
+    monkeypatch.setattr(
+        system_directives,
+        "save_json_atomic",
+        lambda path, data, **kw: writes.append(path) or real_write(path, data, **kw),
+    )
+
+    batch = upsert_system_directives_batch(
+        tmp_path,
+        [
+            {"id": "DIR-1", "title": "One", "body": "v2"},
+            {"id": "DIR-2", "title": "Two", "body": "new"},
+            {"id": "DIR-2", "title": "Two", "body": "newer"},
+        ],
+        updated_by="importer",
+    )
+
+    assert len(writes) == 1
+    assert batch["count"] == 2
+    assert [(r["directive"]["id"], r["created"]) for r in batch["results"]] == [
+        ("DIR-1", False),
+        ("DIR-2", True),
+        ("DIR-2", False),
+    ]
+    stored = {item["id"]: item for item in list_system_directives(tmp_path)}
+    assert stored["DIR-1"]["version"] == 2
+    assert stored["DIR-2"]["body"] == "newer"
+    assert stored["DIR-2"]["version"] == 2
+    assert stored["DIR-2"]["updated_by"] == "importer"
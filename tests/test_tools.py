@@ -5,6 +5,7 @@ import pytest
 from pathlib import Path
 
 from maestro.tools import MaestroTools
+from maestro.utils import load_json, save_json
 
 
 def _add_conflict_pages(store_root: Path) -> None:
@@ -262,6 +263,13 @@ class TestKnowledgeQueries:
         assert len(pages) == 1
         assert pages[0]["name"] == "A101_Floor_Plan_p001"
 
+    def test_list_pages_orders_by_name_and_indexes_disciplines(self, tools):
+        assert [p["name"] for p in tools.list_pages()] == sorted(
+            (p["name"] for p in tools.list_pages()), key=str.lower
+        )
+        assert [p["name"] for p in tools.list_pages(discipline="STRUCTURAL")] == ["S101_Foundation_p001"]
+        assert tools.list_pages(discipline="plumbing") == []
+
     def test_get_sheet_summary(self, tools):
         result = tools.get_sheet_summary("A101")
         assert "Floor Plan" in result
@@ -311,6 +319,24 @@ class TestKnowledgeQueries:
         assert len(results) > 0
         assert any(r["match"] == "A101_Floor_Plan_p001" for r in results if r["type"] == "page")
 
+    def test_search_symbol_query_has_no_results(self, tools):
+        assert tools.search("^^") == "No results for '^^'"
+
+    def test_search_exact_index_key_short_circuits(self, tools, monkeypatch):
+        deep = tools.search("Brick Veneer", deep=True)
+        assert any(r["type"] == "pointer" for r in deep)
+
+        monkeypatch.setattr(tools, "_score_pages_for_query", lambda query: pytest.fail("full scan ran"))
+        results = tools.search("Brick Veneer")
+        assert [(r["type"], r["match"]) for r in results] == [("material", "brick veneer")]
+        assert results[0]["found_in"] == [{"page": "A101_Floor_Plan_p001"}]
+        assert results[0]["deep"] is False
+        assert all("deep" not in r for r in deep)
+
+    def test_search_keeps_substring_matches(self, tools):
+        results = tools.search("proof")
+        assert any(r["type"] == "pointer" and r["match"] == "A101_Floor_Plan_p001/r_100_200_300_400" for r in results)
+
     def test_concept_trace_returns_evidence_bundle(self, tools):
         result = tools.concept_trace("brick waterproofing", limit=4)
         assert isinstance(result, dict)
@@ -381,6 +407,9 @@ class TestKnowledgeQueries:
         assert isinstance(result, dict)
         assert "S101" in result["references_from_this_page"]
 
+    def test_find_cross_references_resolves_short_names(self, tools):
+        assert tools.find_cross_references("A101") == tools.find_cross_references("A101_Floor_Plan_p001")
+
     def test_list_modifications(self, tools):
         result = tools.list_modifications()
         assert len(result) == 1
@@ -391,11 +420,65 @@ class TestKnowledgeQueries:
         assert isinstance(result, list)
         assert any(g["type"] == "broken_ref" for g in result)
 
+    def test_check_gaps_is_memoized_until_reload(self, tools):
+        first = tools.check_gaps()
+        first.clear()
+        assert tools.check_gaps() == tools._gaps
+        cached = tools._gaps
+        tools.reload_project()
+        assert "_gaps" not in tools.__dict__
+        assert tools.check_gaps() == cached
+        assert tools.find_cross_references("S101_Foundation_p001")["pages_that_reference_this"] == []
+
+    def test_resolve_page_is_cached_until_reload(self, tools, monkeypatch):
+        import maestro.tools as tools_module
+
+        calls = []
+        real = tools_module.resolve_page
+        monkeypatch.setattr(tools_module, "resolve_page", lambda project, name: calls.append(name) or real(project, name))
+        page = tools._resolve_page("A101")
+        assert tools._resolve_page("A101") is page
+        assert tools._resolve_page("missing") is None
+        assert tools._resolve_page("missing") is None
+        assert calls == ["A101", "missing"]
+        tools.reload_project()
+        assert tools._resolve_page("A101")["name"] == page["name"]
+        assert calls == ["A101", "missing", "A101"]
+
+    def test_check_gaps_reports_regions_without_pass2_in_order(self, tools):
+        tools.project["pages"]["S101_Foundation_p001"]["regions"] = [
+            {"id": "r_b", "label": "Second"},
+            "not-a-region",
+            {"id": "r_a", "label": "First"},
+        ]
+        missing = [g for g in tools.check_gaps() if g["type"] == "missing_pass2"]
+        assert [(g["page"], g["region"], g["label"]) for g in missing] == [
+            ("S101_Foundation_p001", "r_b", "Second"),
+            ("S101_Foundation_p001", "r_a", "First"),
+        ]
+        structural = tools.list_pages("Structural")
+        assert [p["region_count"] for p in structural] == [3]
+
     def test_company_role_blocks_tools(self, mock_store, monkeypatch):
         monkeypatch.setenv("MAESTRO_AGENT_ROLE", "company")
         with pytest.raises(RuntimeError, match="control-plane only"):
             MaestroTools(store_path=mock_store)
 
+    def test_env_and_role_detection_are_cached_until_reload(self, mock_store, monkeypatch):
+        import maestro.tools as tools_module
+
+        calls = []
+        monkeypatch.setattr(tools_module, "load_dotenv", lambda *a: calls.append("env"))
+        monkeypatch.setattr(tools_module, "is_company_role", lambda *a: calls.append("role") or False)
+        tools_module.reload_env()
+        MaestroTools(store_path=mock_store)
+        MaestroTools(store_path=mock_store)
+        assert calls == ["env", "role"]
+        tools_module.reload_env()
+        MaestroTools(store_path=mock_store)
+        assert calls == ["env", "role", "env", "role"]
+        tools_module.reload_env()
+
     def test_get_access_urls_infers_project_workspace_from_store(self, tmp_path, monkeypatch):
         workspace = tmp_path / "workspace-maestro" / "projects" / "alpha-project"
         store = workspace / "knowledge_store"
@@ -452,6 +535,15 @@ class TestWorkspaces:
         assert len(result) == 1
         assert result[0]["slug"] == "ws1"
 
+    def test_list_workspaces_skips_files_and_empty_dirs(self, tools):
+        tools.create_workspace("Zeta", "Last")
+        tools.create_workspace("Alpha", "First")
+        ws_dir = tools._workspaces_dir()
+        (ws_dir / "stray.txt").write_text("x", encoding="utf-8")
+        (ws_dir / "empty_dir").mkdir()
+        assert [ws["slug"] for ws in tools.list_workspaces()] == ["alpha", "zeta"]
+        assert tools.get_workspace("empty_dir") == "Workspace 'empty_dir' not found."
+
     def test_delete_workspace(self, tools):
         tools.create_workspace("Disposable", "Remove me")
         result = tools.delete_workspace("disposable")
@@ -475,6 +567,59 @@ class TestWorkspaces:
         result = tools.select_pointers("test", "A101_Floor_Plan_p001", ["r_100_200_300_400"])
         assert result["status"] == "selected"
 
+    def test_workspace_page_lookups(self, tools):
+        tools.create_workspace("Test", "Test workspace")
+        tools.add_workspace_page("test", "A101")
+        assert "already in workspace" in tools.add_workspace_page("test", "A101")
+        selected = tools.select_pointers("test", "A101", ["r_100_200_300_400"])
+        assert selected["page"] == "A101_Floor_Plan_p001"
+        assert tools.deselect_pointers("test", "A101_Floor_Plan_p001", ["r_100_200_300_400"])["selected_pointers"] == []
+        assert tools.add_page_description("test", "A101_Floor_Plan_p001", " Plan ")["status"] == "updated"
+        assert tools.get_workspace("test")["pages"][0]["description"] == "Plan"
+        assert "is not in workspace" in tools.clear_highlights("test", "S101_Foundation_p001")
+
+    def test_pointer_selection_skips_noop_saves(self, tools, monkeypatch):
+        tools.create_workspace("Test", "Test workspace")
+        tools.add_workspace_page("test", "A101")
+        page = "A101_Floor_Plan_p001"
+        tools.project["pages"][page]["regions"].append({"id": "r_0_0_1_1"})
+        first = tools.select_pointers("test", page, ["r_100_200_300_400", "r_0_0_1_1"])
+        assert first["selected_pointers"] == ["r_0_0_1_1", "r_100_200_300_400"]
+
+        invalid = tools.select_pointers("test", page, ["r_z", "r_a", "r_z", "r_0_0_1_1"])
+        assert invalid.startswith("Invalid pointer IDs: ['r_a', 'r_z'].")
+
+        monkeypatch.setattr(tools, "_save_workspace", lambda ws: pytest.fail("no-op saved"))
+        assert tools.select_pointers("test", page, ["r_0_0_1_1"])["selected_pointers"] == first["selected_pointers"]
+        assert tools.deselect_pointers("test", page, ["missing"])["selected_pointers"] == first["selected_pointers"]
+
+    def test_gemini_client_reused_until_key_changes(self, tools, monkeypatch):
+        from google import genai
+
+        monkeypatch.setattr(genai, "Client", lambda api_key: object())
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        assert tools._gemini_client() is None
+
+        monkeypatch.setenv("GEMINI_API_KEY", "key-1")
+        client = tools._gemini_client()
+        assert client is not None
+        assert tools._gemini_client() is client
+        monkeypatch.setenv("GEMINI_API_KEY", "key-2")
+        assert tools._gemini_client() is not client
+
+    def test_gemini_client_picks_up_key_added_to_env_file(self, tools, monkeypatch, tmp_path):
+        from google import genai
+
+        monkeypatch.setattr(genai, "Client", lambda api_key: api_key)
+        monkeypatch.setenv("GEMINI_API_KEY", "")  # restore the real environment afterwards
+        monkeypatch.delenv("GEMINI_API_KEY")
+        monkeypatch.chdir(tmp_path)
+        tools._workspace_root = None
+        assert tools._gemini_client() is None
+
+        (tmp_path / ".env").write_text("GEMINI_API_KEY=from-dotenv\n", encoding="utf-8")
+        assert tools._gemini_client() == "from-dotenv"
+
     def test_add_note(self, tools):
         tools.create_workspace("Test", "Test workspace")
         result = tools.add_note("test", "Check waterproofing at entry", source_page="A101")
@@ -486,8 +631,70 @@ class TestWorkspaces:
         result = tools.remove_workspace_page("test", "A101_Floor_Plan_p001")
         assert result["status"] == "removed"
 
+    def test_index_updated_incrementally(self, tools, monkeypatch):
+        tools.create_workspace("Alpha", "First")
+        tools.create_workspace("Beta", "Second")
+        monkeypatch.setattr(tools, "_all_workspaces", lambda: pytest.fail("index rescanned"))
+
+        tools.add_workspace_page("beta", "A101")
+        tools.add_note("beta", "Check flashing")
+        tools.delete_workspace("alpha")
+
+        index = load_json(tools._workspaces_dir() / "_index.json")
+        assert index == [{
+            "slug": "beta",
+            "title": "Beta",
+            "description": "Second",
+            "page_count": 1,
+            "note_count": 1,
+        }]
+
+    def test_commit_workspace_skips_index_write_when_counts_unchanged(self, tools, monkeypatch):
+        import maestro.tools as tools_module
+
+        tools.create_workspace("Alpha", "First")
+        writes = []
+        real_save = tools_module.save_json_atomic
+        monkeypatch.setattr(tools_module, "save_json_atomic", lambda path, data, **kw: writes.append(path.name) or real_save(path, data, **kw))
+
+        ws = tools._load_workspace("alpha")
+        ws.setdefault("generated_images", []).append({"filename": "x.png"})
+        tools._commit_workspace(ws)
+        assert writes == ["workspace.json"]
+
+        ws = tools._load_workspace("alpha")
+        ws["notes"].append({"text": "n"})
+        tools._commit_workspace(ws)
+        assert writes == ["workspace.json", "workspace.json", "_index.json"]
+
+    def test_rebuild_index_recovers_missing_file(self, tools):
+        tools.create_workspace("Alpha", "First")
+        (tools._workspaces_dir() / "_index.json").unlink()
+        tools.add_note("alpha", "Note")
+        index = load_json(tools._workspaces_dir() / "_index.json")
+        assert [(e["slug"], e["note_count"]) for e in index] == [("alpha", 1)]
+
 
 class TestSchedule:
+    def test_derive_schedule_variance_days(self):
+        from maestro.tools import _derive_schedule_variance_days
+
+        assert _derive_schedule_variance_days({}) == 0
+        assert _derive_schedule_variance_days({"activity_updates": "bad"}) == 0
+        assert _derive_schedule_variance_days({"activity_updates": [
+            {"variance_days": 2},
+            {"variance_days": -5},
+            {"variance_days": None},
+            {"variance_days": "x"},
+            "junk",
+        ]}) == -5
+
+    def test_schedule_normalizers_accept_mixed_inputs(self):
+        assert MaestroTools._normalize_schedule_status(" In-Progress ") == "in_progress"
+        assert MaestroTools._normalize_schedule_status(None) == "pending"
+        assert MaestroTools._normalize_schedule_status(["blocked"], default="") == ""
+        assert MaestroTools._normalize_schedule_type("Inspection", default="activity") == "inspection"
+
     def test_get_schedule_status(self, tools):
         status = tools.get_schedule_status()
         assert status["files"]["current_update"] is True
@@ -568,3 +775,119 @@ class TestSchedule:
         missing = tools.close_schedule_item("does_not_exist")
         assert isinstance(missing, str)
         assert "not found" in missing.lower()
+
+    def test_managed_schedule_reuses_cache_until_file_changes(self, tools, monkeypatch):
+        import maestro.tools as tools_module
+
+        tools.upsert_schedule_item("cache_a1", title="Cached item", notes="first")
+        reads = []
+        real_load_json = tools_module.load_json
+        monkeypatch.setattr(tools_module, "load_json", lambda path, default=None: reads.append(path) or real_load_json(path, default))
+
+        items = tools.list_schedule_items()
+        items[0]["title"] = "mutated by caller"
+        again = tools.list_schedule_items()
+        assert again[0]["title"] == "Cached item"
+        assert again[0]["description"] == "first"
+        assert reads == []
+
+        path = tools._managed_schedule_path()
+        save_json(path, {"version": 1, "items": [{"id": "cache_a1", "title": "Edited on disk"}]})
+        assert tools.list_schedule_items()[0]["title"] == "Edited on disk"
+        assert len(reads) == 1
+
+    def test_managed_schedule_cache_sees_replace_with_same_mtime_and_size(self, tools):
+        import os
+
+        tools.upsert_schedule_item("cache_b1", title="Before")
+        assert tools.list_schedule_items()[0]["title"] == "Before"
+        path = tools._managed_schedule_path()
+        st = path.stat()
+        replacement = path.with_name("replacement.json")
+        replacement.write_bytes(path.read_bytes().replace(b'"Before"', b'"Behind"'))
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, path)
+        assert tools.list_schedule_items()[0]["title"] == "Behind"
+
+    def test_schedule_and_workspace_dirs_are_created_once(self, tools, monkeypatch):
+        schedule_dir = tools._schedule_dir()
+        workspaces_dir = tools._workspaces_dir()
+        monkeypatch.setattr(Path, "mkdir", lambda self, *a, **k: pytest.fail(f"mkdir {self}"))
+        assert tools._schedule_dir() is schedule_dir
+        assert tools._workspaces_dir() is workspaces_dir
+        assert tools._managed_schedule_path().parent == schedule_dir
+        monkeypatch.undo()
+        tools.reload_project()
+        assert "_schedule_dir_path" not in tools.__dict__
+        assert tools._schedule_dir() == schedule_dir
+
+    def test_upsert_and_close_stamp_a_single_timestamp(self, tools):
+        created = tools.upsert_schedule_item("stamp_a1", title="Stamp", status="done")["item"]
+        assert created["created_at"] == created["updated_at"] == created["closed_at"]
+        assert load_json(tools._managed_schedule_path())["updated_at"] == created["updated_at"]
+        tools.upsert_schedule_item("stamp_a2", title="Second")
+        closed = tools.close_schedule_item("stamp_a2")["item"]
+        assert closed["closed_at"] == closed["updated_at"]
+
+    def test_noop_upsert_does_not_rewrite_schedule(self, tools):
+        first = tools.upsert_schedule_item("noop_a1", title="Same", owner="andy")["item"]
+        path = tools._managed_schedule_path()
+        before = path.read_bytes()
+        result = tools.upsert_schedule_item("noop_a1", title="Same", owner="andy")
+        assert (result["status"], result["changed"]) == ("updated", False)
+        assert result["item"]["updated_at"] == first["updated_at"]
+        assert path.read_bytes() == before
+        changed = tools.upsert_schedule_item("noop_a1", owner="bea")
+        assert (changed["status"], changed["changed"]) == ("updated", True)
+
+    def test_schedule_item_lookup_uses_first_duplicate_id(self, tools):
+        save_json(tools._managed_schedule_path(), {"version": 1, "items": [
+            {"id": "dup", "title": "First"},
+            {"id": "other", "title": "Other"},
+            {"id": "dup", "title": "Second"},
+        ]})
+        updated = tools.upsert_schedule_item("dup", owner="andy")
+        assert updated["item"]["title"] == "First"
+        assert updated["managed_item_count"] == 3
+        closed = tools.close_schedule_item("other", reason="done")
+        assert closed["item"]["title"] == "Other"
+        assert sorted(item["owner"] for item in tools.list_schedule_items() if item["id"] == "dup") == ["", "andy"]
+        assert "not found" in tools.close_schedule_item("missing")
+
+    def test_schedule_views_drop_malformed_items_at_load(self, tools):
+        save_json(tools._managed_schedule_path(), {"version": 1, "items": [
+            "junk",
+            {"id": "b1", "title": "Blocked", "status": "Blocked", "due_date": "2026-03-02"},
+            {"id": "d1", "title": "Done", "status": "done", "description": "legacy notes"},
+        ]})
+        status = tools.get_schedule_status()
+        assert status["managed"]["item_count"] == 2
+        assert status["managed"]["status_counts"]["blocked"] == 1
+        assert status["managed"]["active_count"] == 1
+        timeline = tools.get_schedule_timeline(month="2026-03")
+        assert [i["id"] for day in timeline["days"] for i in day["items"]] == ["b1"]
+        assert [(i["id"], i["description"]) for i in timeline["unscheduled"]] == [("d1", "legacy notes")]
+
+    def test_list_schedule_items_uses_presorted_positions(self, tools):
+        save_json(tools._managed_schedule_path(), {"version": 1, "items": [
+            {"id": "undated", "title": "Undated", "status": "blocked"},
+            {"id": "late", "title": "Late", "due_date": "2026-05-01", "status": "blocked"},
+            {"id": "early", "title": "Early", "due_date": "2026-01-01"},
+        ]})
+        assert [item["id"] for item in tools.list_schedule_items()] == ["early", "late", "undated"]
+        assert [item["id"] for item in tools.list_schedule_items("Blocked")] == ["late", "undated"]
+        assert tools.list_schedule_items("cancelled") == []
+
+        tools.upsert_schedule_item("undated", due_date="2025-12-01")
+        assert [item["id"] for item in tools.list_schedule_items("blocked")] == ["undated", "late"]
+
+    def test_managed_schedule_cache_holds_slotted_items(self, tools):
+        from maestro.tools import ScheduleItem
+
+        tools.upsert_schedule_item("Slot-A1", title="Slotted", item_type="Inspection", notes="n")
+        cached_items = tools._schedule_cache[1]["items"]
+        assert isinstance(cached_items, tuple)
+        assert all(isinstance(item, ScheduleItem) for item in cached_items)
+        assert not hasattr(cached_items[0], "__dict__")
+        assert cached_items[0].to_dict()["description"] == "n"
+        assert tools.list_schedule_items()[0]["type"] == "inspection"
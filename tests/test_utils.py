@@ -15,6 +15,7 @@ from maestro.utils import (
     slugify_underscore,
     load_json,
     save_json,
+    save_json_atomic,
 )
 
 
@@ -190,3 +191,98 @@ class TestFileHelpers:
         bad = tmp_path / "bad.json"
         bad.write_text("not json!", encoding="utf-8")
         assert load_json(bad) == {}
+
+    def test_save_json_matches_stdlib_layout_with_and_without_orjson(self, tmp_path, monkeypatch):
+        import maestro.utils as utils_module
+
+        data = {"title": "Ünïcode", "items": [1, {"nested": []}], 3: "int key"}
+        expected = json.dumps(data, indent=2, ensure_ascii=False)
+        save_json(tmp_path / "fast.json", data)
+        monkeypatch.setattr(utils_module, "orjson", None)
+        save_json(tmp_path / "std.json", data)
+
+        assert (tmp_path / "fast.json").read_text(encoding="utf-8") == expected
+        assert (tmp_path / "std.json").read_text(encoding="utf-8") == expected
+
+    def test_save_json_atomic_replaces_without_leaving_temp(self, tmp_path):
+        path = tmp_path / "nested" / "data.json"
+        save_json_atomic(path, {"v": 1})
+        save_json_atomic(path, {"v": 2})
+        assert load_json(path) == {"v": 2}
+        assert sorted(p.name for p in path.parent.iterdir()) == ["data.json"]
+
+    def test_save_json_atomic_concurrent_writers_do_not_collide(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        path = tmp_path / "shared.json"
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda n: save_json_atomic(path, {"writer": n, "pad": "x" * 4096}), range(64)))
+        assert load_json(path)["writer"] in range(64)
+        assert [p.name for p in tmp_path.iterdir()] == ["shared.json"]
+
+    def test_save_json_atomic_fsyncs_only_when_asked(self, tmp_path, monkeypatch):
+        import maestro.utils as utils_module
+
+        synced = []
+        monkeypatch.setattr(utils_module.os, "fsync", synced.append)
+        save_json_atomic(tmp_path / "plain.json", {"v": 1})
+        assert synced == []
+        save_json_atomic(tmp_path / "durable.json", {"v": 1}, fsync=True)
+        assert len(synced) == 1
+        assert load_json(tmp_path / "durable.json") == {"v": 1}
+
+    def test_save_json_compact_with_and_without_orjson(self, tmp_path, monkeypatch):
+        import maestro.utils as utils_module
+
+        data = {"a": [1, 2], "ü": {"b": None}}
+        expected = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        save_json(tmp_path / "fast.json", data, indent=None)
+        monkeypatch.setattr(utils_module, "orjson", None)
+        save_json(tmp_path / "std.json", data, indent=None)
+        assert (tmp_path / "fast.json").read_text(encoding="utf-8") == expected
+        assert (tmp_path / "std.json").read_text(encoding="utf-8") == expected
+
+    def test_save_json_keeps_non_finite_floats(self, tmp_path):
+        path = tmp_path / "nan.json"
+        data = {"x": float("nan"), "y": [float("inf"), None]}
+        save_json(path, data)
+        assert path.read_text(encoding="utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+        loaded = load_json(path)
+        assert loaded["x"] != loaded["x"]
+        assert loaded["y"] == [float("inf"), None]
+
+    def test_save_json_mixed_key_types_match_stdlib(self, tmp_path):
+        path = tmp_path / "keys.json"
+        data = {1: "a", "1": "b", None: "c"}
+        save_json(path, data, indent=None)
+        assert path.read_text(encoding="utf-8") == json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    def test_save_json_rejects_what_stdlib_rejects(self, tmp_path):
+        from datetime import datetime
+
+        with pytest.raises(TypeError):
+            save_json(tmp_path / "dt.json", {"when": datetime(2024, 1, 1)})
+
+    def test_save_json_exponent_floats_match_stdlib(self, tmp_path):
+        path = tmp_path / "floats.json"
+        data = {"small": 1e-05, "big": 1e16, "huge": 1.5e300, "plain": [0.0001, 123.25, -0.0]}
+        save_json(path, data, indent=None)
+        assert path.read_text(encoding="utf-8") == json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    def test_save_json_rejects_enum_and_uuid_like_stdlib(self, tmp_path):
+        import enum
+        import uuid
+
+        class Color(enum.Enum):
+            RED = "red"
+
+        with pytest.raises(TypeError):
+            save_json(tmp_path / "enum.json", {"color": Color.RED})
+        with pytest.raises(TypeError):
+            save_json(tmp_path / "uuid.json", [uuid.uuid4()])
+
+    def test_load_json_accepts_stdlib_only_literals(self, tmp_path):
+        path = tmp_path / "nan.json"
+        path.write_bytes(b'\xef\xbb\xbf{"value": NaN}')
+        loaded = load_json(path)
+        assert loaded["value"] != loaded["value"]
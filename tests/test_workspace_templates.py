@@ -129,6 +129,7 @@ def test_render_project_tools_md_uses_awareness_for_workspace_url():
     assert "`maestro_governing_scope`" in content
     assert "`maestro_detect_conflicts`" in content
     assert "`OPENAI_API_KEY` — Active project model key" in content
+    assert "add `--deep`" in content
 
 
 def test_render_personal_tools_md_returns_solo_tools_content():
@@ -139,6 +140,7 @@ def test_render_personal_tools_md_returns_solo_tools_content():
     assert "# TOOLS.md — Maestro Personal" in content
     assert "`OPENAI_API_KEY` — Active default model key" in content
     assert "`maestro_delete_workspace`" in content
+    assert "add `--deep`" in content
     assert "`maestro_governing_scope`" in content
     assert "`maestro_detect_conflicts`" in content
 